@@ -22,10 +22,11 @@ Interview Highlights:
 - CI/CD and cloud integration ready
 """
 
+import os
 from enum import Enum
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 from urllib.parse import urlparse
 
 from pydantic import (
@@ -268,6 +269,12 @@ class LoggingSettings(BaseModel):
     # Advanced features
     correlation_id_enabled: bool = Field(default=True)
     performance_logging: bool = Field(default=True)
+    max_repr_len: int = Field(
+        default=1000,
+        ge=80,
+        le=1_000_000,
+        description="Longest string form of a value kept in assertion failure reports"
+    )
 
     @field_validator("level")
     @classmethod
@@ -588,10 +595,83 @@ def get_settings() -> Settings:
     return Settings()
 
 
-def reload_settings() -> Settings:
-    """Force reload settings by clearing cache."""
+# (fingerprint, settings) from the last reload_settings() rebuild
+_LAST_RELOAD: Optional[Tuple[int, Settings]] = None
+
+
+@lru_cache(maxsize=1)
+def _settings_env_keys() -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+    """Upper-cased variable names and nested prefixes that Settings reads."""
+    names = set()
+    for name, field in Settings.model_fields.items():
+        alias = field.validation_alias
+        names.add((alias if isinstance(alias, str) else name).upper())
+    return frozenset(names), tuple(f"{name}__" for name in names)
+
+
+def _path_stamp(path: Union[str, Path]) -> Tuple[str, Optional[int], Optional[int]]:
+    """(path, mtime, size) of a file or directory; (path, None, None) if missing."""
+    try:
+        stat = Path(path).stat()
+        return str(path), stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return str(path), None, None
+
+
+def _secrets_stamp() -> Tuple[Tuple[str, Optional[int], Optional[int]], ...]:
+    """Stamps of the secrets directories and the secret files in them."""
+    secrets_dir = Settings.model_config.get("secrets_dir")
+    if not secrets_dir:
+        return ()
+    if isinstance(secrets_dir, (str, os.PathLike)):
+        secrets_dir = [secrets_dir]
+
+    stamps = []
+    for directory in secrets_dir:
+        stamps.append(_path_stamp(directory))
+        try:
+            entries = sorted(Path(directory).iterdir())
+        except OSError:
+            continue
+        stamps.extend(_path_stamp(entry) for entry in entries)
+    return tuple(stamps)
+
+
+def _settings_fingerprint() -> int:
+    """Hash of all settings sources: env vars, cwd, .env files and secrets."""
+    names, prefixes = _settings_env_keys()
+    env = frozenset(
+        (key, value) for key, value in
+        ((k.upper(), v) for k, v in os.environ.items())
+        if key in names or key.startswith(prefixes)
+    )
+    env_files = tuple(_path_stamp(env_file) for env_file in Settings.model_config["env_file"])
+    return hash((env, os.getcwd(), env_files, _secrets_stamp()))
+
+
+def reload_settings(force: bool = False) -> Settings:
+    """
+    Reload settings by clearing cache.
+
+    The reload is skipped when the relevant environment variables, the
+    working directory, the .env files and the secrets directory are
+    unchanged since the last reload; pass force=True to rebuild regardless (e.g. after mutating
+    the cached instance).
+    """
+    global _LAST_RELOAD
+    fingerprint = _settings_fingerprint()
+    # Reuse only if the cache still holds the instance built for this
+    # fingerprint; get_settings may have been cleared and rebuilt elsewhere
+    if (not force and _LAST_RELOAD is not None
+            and _LAST_RELOAD[0] == fingerprint
+            and get_settings.cache_info().currsize
+            and get_settings() is _LAST_RELOAD[1]):
+        return _LAST_RELOAD[1]
+
     get_settings.cache_clear()
-    return get_settings()
+    settings = get_settings()
+    _LAST_RELOAD = (fingerprint, settings)
+    return settings
 
 
 # Environment-specific factory functions
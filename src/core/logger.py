@@ -22,15 +22,17 @@ Interview Highlights:
 - Context-aware logging with automatic enrichment
 """
 
+import atexit
 import json
 import logging
 import logging.handlers
+import queue
 import sys
 import time
 from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from uuid import uuid4
 
 import structlog
@@ -125,6 +127,7 @@ class LoggingManager:
         self._configured = False
         self._loggers: Dict[str, structlog.BoundLogger] = {}
         self._log_file_handlers: List[logging.Handler] = []
+        self._queue_listeners: List[logging.handlers.QueueListener] = []
 
     def configure_logging(
             self,
@@ -241,8 +244,31 @@ class LoggingManager:
         )
         file_handler.setLevel(logging.DEBUG)
 
-        root_logger.addHandler(file_handler)
+        # Records are handed to a listener thread that owns the file, so
+        # logging calls never wait on disk I/O
+        queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+        listener = logging.handlers.QueueListener(
+            queue_handler.queue, file_handler, respect_handler_level=True
+        )
+        listener.start()
+        if not self._queue_listeners:
+            atexit.register(self._stop_listeners)
+
+        root_logger.addHandler(queue_handler)
         self._log_file_handlers.append(file_handler)
+        self._queue_listeners.append(listener)
+
+    def flush(self) -> None:
+        """Block until every queued log record has been written to its file."""
+        for listener in self._queue_listeners:
+            # stop() drains the queue before joining the thread
+            listener.stop()
+            listener.start()
+
+    def _stop_listeners(self) -> None:
+        """Drain and stop file listeners at interpreter exit."""
+        for listener in self._queue_listeners:
+            listener.stop()
 
     def _add_correlation_context(self, logger, method_name, event_dict):
         """Add correlation context to log entries."""
@@ -372,6 +398,16 @@ def setup_logging(
     )
 
 
+def flush_logs() -> None:
+    """
+    Wait until queued log records have been written to the log files.
+
+    File output is written on a background thread; call this before
+    reading a log file the current process has just written.
+    """
+    _logging_manager.flush()
+
+
 def get_logger(name: str = "automation") -> structlog.BoundLogger:
     """
     Get a configured logger instance.
@@ -549,4 +585,39 @@ def log_assertion(assertion_type: str, expected: Any, actual: Any, passed: bool)
         actual=actual,
         passed=passed,
         event_type="assertion"
-    )
\ No newline at end of file
+    )
+
+
+def log_assertion_batch(records: Sequence[Tuple[str, Any, Any, bool]]) -> None:
+    """
+    Log many assertion results as a single structured event.
+
+    Args:
+        records: (assertion_type, expected, actual, passed) tuples, in the
+            same shape as the log_assertion arguments
+
+    Example:
+        >>> log_assertion_batch([("equals", 1, 1, True), ("contains", "a", "bcd", False)])
+    """
+    if not records:
+        return
+
+    failed = sum(1 for record in records if not record[3])
+    logger = get_logger("assertions")
+    log_method = logger.error if failed else logger.info
+
+    log_method(
+        f"Assertion batch: {len(records)} assertions, {failed} failed",
+        assertions=[
+            {
+                "assertion_type": assertion_type,
+                "expected": expected,
+                "actual": actual,
+                "passed": passed,
+            }
+            for assertion_type, expected, actual, passed in records
+        ],
+        total=len(records),
+        failed=failed,
+        event_type="assertion_batch"
+    )
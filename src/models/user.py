@@ -10,6 +10,7 @@ Key Domain Concepts:
 - UserProfile: Extended user information
 - UserCredentials: Authentication credentials
 - UserPreferences: User settings and preferences
+- UserRead: Lightweight read-only snapshot for listing and caching
 
 Interview Highlights:
 - Domain-driven design with rich user models
@@ -18,81 +19,38 @@ Interview Highlights:
 - Type-safe user state management
 """
 
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
-from enum import Enum
-from typing import Any, Dict, List, Optional, Set
-from uuid import uuid4
+from operator import attrgetter
+from secrets import token_urlsafe
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Union
 
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
     SecretStr,
+    TypeAdapter,
     field_validator,
     model_validator,
     computed_field
 )
 
 from base import BaseEntity, Address, ContactInfo, AuditInfo
+from user_enums import Gender, Permission, UserRole, UserStatus, _ROLE_MASKS
 
+# Common disposable email domains blocked at registration
+_BLOCKED_DOMAINS = frozenset({
+    "tempmail.com", "10minutemail.com", "guerrillamail.com"
+})
 
-class UserRole(str, Enum):
-    """User roles for access control."""
-
-    CUSTOMER = "customer"
-    ADMIN = "admin"
-    MODERATOR = "moderator"
-    GUEST = "guest"
-
-    def get_permissions(self) -> Set[str]:
-        """Get permissions for this role."""
-        permission_map = {
-            UserRole.GUEST: {"view_products", "view_categories"},
-            UserRole.CUSTOMER: {
-                "view_products", "view_categories", "place_orders",
-                "view_own_orders", "manage_own_profile", "add_to_cart"
-            },
-            UserRole.MODERATOR: {
-                "view_products", "view_categories", "moderate_reviews",
-                "view_user_profiles", "manage_products"
-            },
-            UserRole.ADMIN: {
-                "view_products", "view_categories", "place_orders",
-                "view_own_orders", "manage_own_profile", "add_to_cart",
-                "moderate_reviews", "view_user_profiles", "manage_products",
-                "manage_users", "view_analytics", "system_admin"
-            }
-        }
-        return permission_map.get(self, set())
-
-
-class UserStatus(str, Enum):
-    """User account status."""
-
-    ACTIVE = "active"
-    INACTIVE = "inactive"
-    SUSPENDED = "suspended"
-    PENDING_VERIFICATION = "pending_verification"
-    LOCKED = "locked"
 
-    @property
-    def can_login(self) -> bool:
-        """Check if user can log in with this status."""
-        return self in [UserStatus.ACTIVE]
-
-    @property
-    def requires_verification(self) -> bool:
-        """Check if status requires email verification."""
-        return self == UserStatus.PENDING_VERIFICATION
-
-
-class Gender(str, Enum):
-    """Gender options."""
-
-    MALE = "male"
-    FEMALE = "female"
-    OTHER = "other"
-    PREFER_NOT_TO_SAY = "prefer_not_to_say"
+def _age_years(dob: datetime, now: datetime) -> int:
+    """Whole years between date of birth and now, using calendar dates."""
+    years = now.year - dob.year
+    if (now.month, now.day) < (dob.month, dob.day):
+        years -= 1
+    return years
 
 
 class UserCredentials(BaseModel):
@@ -106,7 +64,7 @@ class UserCredentials(BaseModel):
     model_config = ConfigDict(
         # Don't include credentials in string representation
         repr_include={"username"},
-        validate_assignment=True
+        extra="forbid"
     )
 
     username: str = Field(
@@ -157,16 +115,14 @@ class UserCredentials(BaseModel):
     @classmethod
     def validate_email_domain(cls, v: str) -> str:
         """Additional email validation."""
-        # Block common disposable email domains in production
-        blocked_domains = {
-            "tempmail.com", "10minutemail.com", "guerrillamail.com"
-        }
+        at = v.rfind("@")
+        domain = v[at + 1:].lower()
 
-        domain = v.split("@")[1].lower()
-        if domain in blocked_domains:
+        # Block common disposable email domains in production
+        if domain in _BLOCKED_DOMAINS:
             raise ValueError(f"Email domain {domain} is not allowed")
 
-        return v.lower()  # Normalize to lowercase
+        return v[:at + 1] + domain  # Normalize domain to lowercase
 
     @model_validator(mode="after")
     def validate_lock_status(self) -> "UserCredentials":
@@ -178,7 +134,6 @@ class UserCredentials(BaseModel):
 
         return self
 
-    @computed_field
     @property
     def is_locked(self) -> bool:
         """Check if account is currently locked."""
@@ -186,9 +141,15 @@ class UserCredentials(BaseModel):
             return False
         return self.locked_until > datetime.now(timezone.utc)
 
+    def _set_login_attempts(self, attempts: int) -> None:
+        """Set login attempts, enforcing the field bound without re-validation."""
+        if attempts < 0:
+            raise ValueError("login_attempts cannot be negative")
+        self.login_attempts = attempts
+
     def increment_login_attempts(self) -> None:
         """Increment failed login attempts and lock if necessary."""
-        self.login_attempts += 1
+        self._set_login_attempts(self.login_attempts + 1)
 
         # Lock account after 5 failed attempts for 30 minutes
         if self.login_attempts >= 5:
@@ -198,7 +159,7 @@ class UserCredentials(BaseModel):
 
     def reset_login_attempts(self) -> None:
         """Reset login attempts after successful login."""
-        self.login_attempts = 0
+        self._set_login_attempts(0)
         self.locked_until = None
         self.last_login = datetime.now(timezone.utc)
 
@@ -211,10 +172,7 @@ class UserProfile(BaseModel):
     related user data.
     """
 
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True
-    )
+    model_config = ConfigDict(str_strip_whitespace=True)
 
     first_name: str = Field(
         min_length=1,
@@ -306,8 +264,7 @@ class UserProfile(BaseModel):
         if not v:
             return v
 
-        now = datetime.now(timezone.utc)
-        age_years = (now - v).days / 365.25
+        age_years = _age_years(v, datetime.now(timezone.utc))
 
         if age_years < 13:
             raise ValueError("User must be at least 13 years old")
@@ -317,10 +274,13 @@ class UserProfile(BaseModel):
 
         return v
 
-    @field_validator("display_name", mode="after")
+    @field_validator("display_name", mode="before")
     @classmethod
-    def generate_display_name(cls, v: Optional[str], info) -> Optional[str]:
+    def generate_display_name(cls, v: Any, info) -> Any:
         """Generate display name if not provided."""
+        # Raw input: strip first so whitespace-only counts as not provided
+        if isinstance(v, str):
+            v = v.strip()
         if v:
             return v
 
@@ -346,8 +306,7 @@ class UserProfile(BaseModel):
         if not self.date_of_birth:
             return None
 
-        now = datetime.now(timezone.utc)
-        return int((now - self.date_of_birth).days / 365.25)
+        return _age_years(self.date_of_birth, datetime.now(timezone.utc))
 
     def get_primary_address(self) -> Optional[Address]:
         """Get the primary (first) address."""
@@ -360,6 +319,26 @@ class UserProfile(BaseModel):
         self.addresses.append(address)
 
 
+def _enum_value(value: Any) -> Any:
+    """Get the plain value of an enum field stored as a member or as its value."""
+    return getattr(value, "value", value)
+
+
+# Public (API-safe) user fields as (key, getter) pairs, built once at import
+_PUBLIC_FIELDS = (
+    ("id", attrgetter("id")),
+    ("username", attrgetter("credentials.username")),
+    ("display_name", attrgetter("display_identifier")),
+    ("role", lambda u: _enum_value(u.role)),
+    ("status", lambda u: _enum_value(u.status)),
+    ("email_verified", attrgetter("email_verified")),
+    ("created_at", lambda u: u.created_at.isoformat()),
+    ("last_activity", lambda u: u.last_activity.isoformat() if u.last_activity else None),
+)
+
+_PUBLIC_PROFILE_FIELDS = ("first_name", "last_name", "display_name", "avatar_url", "bio")
+
+
 class User(BaseEntity):
     """
     Main user entity combining credentials, profile, and system data.
@@ -406,7 +385,7 @@ class User(BaseEntity):
 
     verification_token: Optional[str] = Field(
         default=None,
-        description="Email verification token",
+        description="URL-safe email verification token (32 chars, 192 bits)",
         repr=False  # Don't show in repr
     )
 
@@ -436,13 +415,11 @@ class User(BaseEntity):
 
         return self
 
-    @computed_field
     @property
-    def permissions(self) -> Set[str]:
+    def permissions(self) -> FrozenSet[str]:
         """Get user permissions based on role."""
         return self.role.get_permissions()
 
-    @computed_field
     @property
     def can_login(self) -> bool:
         """Check if user can log in."""
@@ -460,9 +437,13 @@ class User(BaseEntity):
             return self.profile.display_name
         return self.profile.full_name
 
-    def has_permission(self, permission: str) -> bool:
-        """Check if user has specific permission."""
-        return permission in self.permissions
+    def has_permission(self, permission: Union[Permission, str]) -> bool:
+        """Check if user has specific permission (Permission flag or legacy name)."""
+        if isinstance(permission, str):
+            permission = Permission.__members__.get(permission.upper())
+            if permission is None:
+                return False
+        return bool(_ROLE_MASKS.get(self.role, Permission(0)) & permission)
 
     def activate(self) -> None:
         """Activate user account after verification."""
@@ -516,23 +497,12 @@ class User(BaseEntity):
 
         Excludes sensitive information like passwords, tokens, etc.
         """
-        return {
-            "id": self.id,
-            "username": self.credentials.username,
-            "display_name": self.display_identifier,
-            "role": self.role.value,
-            "status": self.status.value,
-            "email_verified": self.email_verified,
-            "created_at": self.created_at.isoformat(),
-            "last_activity": self.last_activity.isoformat() if self.last_activity else None,
-            "profile": {
-                "first_name": self.profile.first_name,
-                "last_name": self.profile.last_name,
-                "display_name": self.profile.display_name,
-                "avatar_url": self.profile.avatar_url,
-                "bio": self.profile.bio,
-            }
-        }
+        data = {key: getter(self) for key, getter in _PUBLIC_FIELDS}
+
+        profile = self.profile
+        data["profile"] = {name: getattr(profile, name) for name in _PUBLIC_PROFILE_FIELDS}
+
+        return data
 
     @classmethod
     def create_new_user(
@@ -576,7 +546,7 @@ class User(BaseEntity):
             **kwargs.get("profile", {})
         )
 
-        verification_token = str(uuid4())
+        verification_token = token_urlsafe(24)
 
         return cls(
             credentials=credentials,
@@ -589,4 +559,119 @@ class User(BaseEntity):
                 source=kwargs.get("source", "registration")
             ),
             **{k: v for k, v in kwargs.items() if k not in ["profile", "created_by", "source"]}
-        )
\ No newline at end of file
+        )
+
+    @classmethod
+    def bulk_validate(cls, rows: List[Dict[str, Any]]) -> List["User"]:
+        """
+        Validate a batch of raw user rows in one call.
+
+        Args:
+            rows: Raw user dictionaries (e.g. from a CSV/JSON import)
+
+        Returns:
+            List of validated User instances
+        """
+        return _USERS_ADAPTER.validate_python(rows)
+
+
+# Shared adapter for bulk ingest, built once after User is defined
+_USERS_ADAPTER: TypeAdapter[List[User]] = TypeAdapter(List[User])
+
+
+def score_users(users: Iterable[User], min_age: Optional[int] = None) -> List[bool]:
+    """
+    Score users for login eligibility in bulk.
+
+    A user is eligible when active, email-verified, not locked and, if
+    min_age is given, at least that old. The reference time is read once
+    for the whole batch instead of once per property access.
+
+    Args:
+        users: Users to score
+        min_age: Optional minimum age in years
+
+    Returns:
+        Eligibility flags in input order
+    """
+    now = datetime.now(timezone.utc)
+    active = UserStatus.ACTIVE
+    results = []
+
+    for user in users:
+        credentials = user.credentials
+        locked_until = credentials.locked_until
+        eligible = (
+                user.status == active and
+                user.email_verified and
+                not (locked_until and locked_until > now)
+        )
+
+        if eligible and min_age is not None:
+            dob = user.profile.date_of_birth
+            eligible = dob is not None and _age_years(dob, now) >= min_age
+
+        results.append(bool(eligible))
+
+    return results
+
+
+@dataclass(frozen=True, slots=True)
+class UserProfileRead:
+    """Read-only public profile snapshot."""
+
+    first_name: str
+    last_name: str
+    display_name: Optional[str] = None
+    avatar_url: Optional[str] = None
+    bio: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class UserRead:
+    """
+    Read-only public user snapshot for read-heavy paths.
+
+    Mirrors the payload of User.to_public_dict() without pydantic
+    validation, so listing, caching and response serialization don't
+    pay for the validator chain. Keep User for the write path.
+    """
+
+    id: str
+    username: str
+    display_name: str
+    role: str
+    status: str
+    email_verified: bool
+    created_at: datetime
+    profile: UserProfileRead
+    last_activity: Optional[datetime] = None
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserRead":
+        """Create snapshot from a validated User."""
+        profile = user.profile
+        return cls(
+            id=user.id,
+            username=user.credentials.username,
+            display_name=user.display_identifier,
+            role=_enum_value(user.role),
+            status=_enum_value(user.status),
+            email_verified=user.email_verified,
+            created_at=user.created_at,
+            last_activity=user.last_activity,
+            profile=UserProfileRead(
+                first_name=profile.first_name,
+                last_name=profile.last_name,
+                display_name=profile.display_name,
+                avatar_url=profile.avatar_url,
+                bio=profile.bio
+            )
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary with ISO formatted timestamps."""
+        data = asdict(self)
+        data["created_at"] = self.created_at.isoformat()
+        data["last_activity"] = self.last_activity.isoformat() if self.last_activity else None
+        return data
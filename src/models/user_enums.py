@@ -0,0 +1,115 @@
+# src/models/user_enums.py
+"""
+User Domain Enumerations
+
+Roles, statuses and permissions for the user domain, kept free of
+pydantic so permission checks (e.g. in middleware) can import them
+without loading the model machinery. Re-exported from user.py.
+"""
+
+from enum import Enum, IntFlag
+from typing import Dict, FrozenSet
+
+
+class Permission(IntFlag):
+    """Permission bits for role-based access checks."""
+
+    VIEW_PRODUCTS = 1
+    VIEW_CATEGORIES = 2
+    PLACE_ORDERS = 4
+    VIEW_OWN_ORDERS = 8
+    MANAGE_OWN_PROFILE = 16
+    ADD_TO_CART = 32
+    MODERATE_REVIEWS = 64
+    VIEW_USER_PROFILES = 128
+    MANAGE_PRODUCTS = 256
+    MANAGE_USERS = 512
+    VIEW_ANALYTICS = 1024
+    SYSTEM_ADMIN = 2048
+
+
+class UserRole(str, Enum):
+    """User roles for access control."""
+
+    CUSTOMER = "customer"
+    ADMIN = "admin"
+    MODERATOR = "moderator"
+    GUEST = "guest"
+
+    @property
+    def permission_mask(self) -> Permission:
+        """Get permission bitmask for this role."""
+        return _ROLE_MASKS.get(self, Permission(0))
+
+    def get_permissions(self) -> FrozenSet[str]:
+        """Get permissions for this role."""
+        match self:
+            case UserRole.CUSTOMER:
+                return _PERM_CUSTOMER
+            case UserRole.ADMIN:
+                return _PERM_ADMIN
+            case UserRole.MODERATOR:
+                return _PERM_MODERATOR
+            case UserRole.GUEST:
+                return _PERM_GUEST
+        return frozenset()
+
+
+_ROLE_MASKS: Dict[UserRole, Permission] = {
+    UserRole.GUEST: Permission.VIEW_PRODUCTS | Permission.VIEW_CATEGORIES,
+    UserRole.CUSTOMER: (
+        Permission.VIEW_PRODUCTS | Permission.VIEW_CATEGORIES | Permission.PLACE_ORDERS |
+        Permission.VIEW_OWN_ORDERS | Permission.MANAGE_OWN_PROFILE | Permission.ADD_TO_CART
+    ),
+    UserRole.MODERATOR: (
+        Permission.VIEW_PRODUCTS | Permission.VIEW_CATEGORIES | Permission.MODERATE_REVIEWS |
+        Permission.VIEW_USER_PROFILES | Permission.MANAGE_PRODUCTS
+    ),
+    UserRole.ADMIN: (
+        Permission.VIEW_PRODUCTS | Permission.VIEW_CATEGORIES | Permission.PLACE_ORDERS |
+        Permission.VIEW_OWN_ORDERS | Permission.MANAGE_OWN_PROFILE | Permission.ADD_TO_CART |
+        Permission.MODERATE_REVIEWS | Permission.VIEW_USER_PROFILES | Permission.MANAGE_PRODUCTS |
+        Permission.MANAGE_USERS | Permission.VIEW_ANALYTICS | Permission.SYSTEM_ADMIN
+    )
+}
+
+
+def _permission_names(mask: Permission) -> FrozenSet[str]:
+    """Expand a permission mask into legacy permission names."""
+    return frozenset(p.name.lower() for p in Permission if p & mask)
+
+
+# Pre-built legacy permission name sets per role
+_PERM_GUEST = _permission_names(_ROLE_MASKS[UserRole.GUEST])
+_PERM_CUSTOMER = _permission_names(_ROLE_MASKS[UserRole.CUSTOMER])
+_PERM_MODERATOR = _permission_names(_ROLE_MASKS[UserRole.MODERATOR])
+_PERM_ADMIN = _permission_names(_ROLE_MASKS[UserRole.ADMIN])
+
+
+class UserStatus(str, Enum):
+    """User account status."""
+
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+    SUSPENDED = "suspended"
+    PENDING_VERIFICATION = "pending_verification"
+    LOCKED = "locked"
+
+    @property
+    def can_login(self) -> bool:
+        """Check if user can log in with this status."""
+        return self in [UserStatus.ACTIVE]
+
+    @property
+    def requires_verification(self) -> bool:
+        """Check if status requires email verification."""
+        return self == UserStatus.PENDING_VERIFICATION
+
+
+class Gender(str, Enum):
+    """Gender options."""
+
+    MALE = "male"
+    FEMALE = "female"
+    OTHER = "other"
+    PREFER_NOT_TO_SAY = "prefer_not_to_say"
@@ -21,19 +21,141 @@ Interview Highlights:
 """
 
 import asyncio
+import inspect
+import logging
+import operator
+import random
+import re
 import time
+from contextlib import nullcontext
 from enum import Enum
-from typing import Any, Callable, Optional, Union, Dict, List
-from functools import wraps
+from typing import Any, Awaitable, Callable, Optional, Union, Dict, List
+from functools import lru_cache, wraps
+from weakref import WeakKeyDictionary, WeakSet, WeakValueDictionary
 
-from playwright.sync_api import Page, Locator, expect
-from playwright.async_api import Page as AsyncPage, Locator as AsyncLocator
+from playwright.sync_api import (
+    Page, Locator, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError, expect
+)
+from playwright.async_api import Page as AsyncPage, Locator as AsyncLocator, expect as async_expect
 
-from src.config.settings import get_settings
+from src.config.settings import Settings, get_settings
 from src.core.logger import get_logger, get_performance_timer
 from src.core.exceptions import TimeoutException, ElementException
 from src.core.exceptions.enums import ErrorSeverity
 
+# Polling backoff: start fast, then grow the sleep up to a cap
+POLL_INITIAL_INTERVAL = 0.005
+POLL_MAX_INTERVAL = 0.2
+POLL_BACKOFF = 2.0
+
+# Asset-loading helper installed once per page (current document and every
+# later navigation), so each wait only sends a short call expression.
+# Fonts and images settle together via Promise.all; a failed image also settles
+_ASSETS_INIT_JS = """
+window.__waitForAssets = (fonts, images) => Promise.all([
+    fonts && document.fonts ? document.fonts.ready : null,
+    ...(images ? Array.from(document.images).filter(img => !img.complete).map(
+        img => new Promise(resolve => {
+            img.addEventListener('load', resolve, {once: true});
+            img.addEventListener('error', resolve, {once: true});
+        })
+    ) : [])
+]).then(() => true)
+"""
+_ASSETS_WAIT_JS = "([fonts, images]) => window.__waitForAssets(fonts, images)"
+_ASSETS_READY_PAGES: "WeakSet[Any]" = WeakSet()
+
+# Comparison names accepted by wait_for_element_count
+_COMPARATORS: Dict[str, Callable[[int, int], bool]] = {
+    "equal": operator.eq,
+    "greater": operator.gt,
+    "less": operator.lt,
+    "greater_equal": operator.ge,
+    "less_equal": operator.le,
+}
+
+# Browser-side predicates for text removal and URL change
+_TEXT_GONE_JS = "(els, text) => els.every(el => !(el.textContent || '').includes(text))"
+_URL_CHANGED_JS = (
+    "([current, fragment]) => fragment"
+    " ? location.href.includes(fragment) : location.href !== current"
+)
+
+# Element rect sampled twice, one animation frame apart: [x, y, w, h] * 2
+_STABILITY_JS = """
+el => new Promise(resolve => {
+    const a = el.getBoundingClientRect();
+    requestAnimationFrame(() => {
+        const b = el.getBoundingClientRect();
+        resolve([a.x, a.y, a.width, a.height, b.x, b.y, b.width, b.height]);
+    });
+})
+"""
+
+
+def _rects_match(a: List[float], b: List[float], tolerance: float = 1.0) -> bool:
+    """Check two [x, y, w, h] rects agree within tolerance in every component."""
+    return max(map(abs, map(operator.sub, a, b))) <= tolerance
+
+
+def _stability_tracker(stability_duration: float, min_samples: int) -> Callable[[Any], bool]:
+    """
+    Build a stateful check fed one _STABILITY_JS sample per poll.
+
+    Returns True once min_samples consecutive samples matched (within and
+    across polls) over at least stability_duration seconds.
+    """
+    last_box = None
+    stable_since = 0.0
+    matches = 0
+
+    def observe(sample: Optional[List[float]]) -> bool:
+        nonlocal last_box, stable_since, matches
+        if not sample or not (sample[6] or sample[7]):
+            last_box = None
+            return False
+
+        first, box = sample[:4], sample[4:]
+        now = time.perf_counter()
+        # Compare positions (allow 1px tolerance); any movement restarts the window
+        if last_box is None or not (
+                _rects_match(first, box) and _rects_match(box, last_box)
+        ):
+            last_box = box
+            stable_since = now
+            matches = 0
+            return False
+
+        matches += 1
+        return matches >= min_samples and now - stable_since >= stability_duration
+
+    return observe
+
+
+# Per-page memo of selector -> Locator, dropped whenever a frame navigates
+_LOCATOR_CACHE: "WeakKeyDictionary[Any, Dict[str, Any]]" = WeakKeyDictionary()
+
+
+@lru_cache(maxsize=4096)
+def _normalize_selector(selector: str) -> str:
+    """Return canonical selector form (trimmed, explicit xpath= engine)."""
+    selector = selector.strip()
+    if selector.startswith(("//", "(//")):
+        return f"xpath={selector}"
+    return selector
+
+# Module-wide logger, resolved on first use so that importing this module
+# does not configure logging ahead of setup_logging()
+_LOGGER = None
+
+
+def _logger():
+    """Get the wait helpers logger, cached after the first lookup."""
+    global _LOGGER
+    if _LOGGER is None:
+        _LOGGER = get_logger("wait_helpers")
+    return _LOGGER
+
 
 class WaitCondition(str, Enum):
     """
@@ -102,41 +224,154 @@ class NetworkWaitCondition(str, Enum):
     """Page navigation committed."""
 
 
-class SmartWaiter:
+class _WaiterBase:
+    """Page, settings and locator handling shared by the sync and async waiters."""
+
+    def __init__(self, page: Union[Page, AsyncPage]):
+        """
+        Initialize smart waiter.
+
+        Args:
+            page: Playwright page instance
+        """
+        self.page = page
+        self.logger = _logger()
+
+    @property
+    def settings(self) -> Settings:
+        """Current settings; get_settings() is cached and sees every reload."""
+        return get_settings()
+
+    @property
+    def default_timeout(self) -> int:
+        """Default wait timeout in milliseconds, from the current settings."""
+        return get_settings().browser.timeout
+
+    def _locator(self, selector: str) -> Union[Locator, AsyncLocator]:
+        """Get locator for selector, memoized per page until it navigates."""
+        selector = _normalize_selector(selector)
+        try:
+            cache = _LOCATOR_CACHE[self.page]
+        except KeyError:
+            cache = _LOCATOR_CACHE[self.page] = {}
+            self.page.on("framenavigated", lambda frame: cache.clear())
+            # Cached locators hold the page, so drop the entry on close
+            self.page.on("close", lambda closed: _LOCATOR_CACHE.pop(closed, None))
+
+        locator = cache.get(selector)
+        if locator is None:
+            locator = cache[selector] = self.page.locator(selector)
+        return locator
+
+
+class SmartWaiter(_WaiterBase):
     """
     Intelligent waiting system with performance optimization.
 
     This class provides sophisticated waiting mechanisms that
     combine multiple conditions and optimize for performance.
+
+    SmartWaiter(page) picks the implementation once, at construction:
+    SyncSmartWaiter for sync pages and AsyncSmartWaiter (whose wait
+    methods are coroutines) for async pages. AsyncSmartWaiter is not a
+    SmartWaiter subclass, so isinstance(waiter, SmartWaiter) means the
+    wait methods block and return results directly.
     """
 
-    def __init__(self, page: Union[Page, AsyncPage]):
+    def __new__(cls, page: Union[Page, AsyncPage]):
+        if cls is SmartWaiter:
+            if isinstance(page, AsyncPage):
+                # Fully built here; type() skips __init__ for non-subclasses
+                return AsyncSmartWaiter(page)
+            cls = SyncSmartWaiter
+        return super().__new__(cls)
+
+    def wait_for(
+            self,
+            condition_type: WaitCondition,
+            selector: str,
+            timeout: Optional[int] = None,
+            **kwargs
+    ) -> bool:
         """
-        Initialize smart waiter.
+        Wait for a factory condition on the element matching selector.
+
+        Plain CSS selectors run as a single browser-side wait_for_function;
+        other selector engines poll the same check via evaluate_all.
+        STABLE and COUNT map to their dedicated wait methods.
 
         Args:
-            page: Playwright page instance
+            condition_type: Type of condition to wait for
+            selector: Element selector
+            timeout: Maximum wait time
+            **kwargs: Additional parameters for condition
+
+        Returns:
+            True when condition is met
+
+        Raises:
+            TimeoutException: If condition not met within timeout
         """
-        self.page = page
-        self.settings = get_settings()
-        self.logger = get_logger("wait_helpers")
-        self.default_timeout = self.settings.browser.timeout
+        timeout = timeout or self.default_timeout
+
+        if condition_type == WaitCondition.STABLE:
+            return self.wait_for_element_stable(self._locator(selector), timeout)
+        if condition_type == WaitCondition.COUNT:
+            return self.wait_for_element_count(
+                selector, kwargs.get("count", 1), timeout, kwargs.get("comparison", "equal")
+            )
+
+        script = WaitConditionFactory.to_js_predicate(condition_type, selector, kwargs)
+        if script is not None:
+            try:
+                self.page.wait_for_function(script, arg=[selector, kwargs], timeout=timeout)
+                return True
+
+            except PlaywrightTimeoutError as e:
+                raise TimeoutException(
+                    f"Condition '{condition_type}' not met for {selector} within {timeout}ms",
+                    timeout_duration=timeout / 1000,
+                    operation_type="wait_for",
+                    original_exception=e
+                ) from e
+
+            except PlaywrightError:
+                # The browser rejected the selector; retry through the locator
+                pass
+
+        locator = self._locator(selector)
+        element_script = _JS_ELEMENT_PREDICATES[condition_type]
+        return self.wait_for_condition(
+            lambda: locator.evaluate_all(element_script, kwargs),
+            timeout=timeout,
+            timeout_message=f"Condition '{condition_type}' not met for {selector}"
+        )
 
     def wait_for_condition(
             self,
             condition: Callable[[], bool],
             timeout: Optional[int] = None,
-            poll_interval: float = 0.1,
-            timeout_message: Optional[str] = None
+            timeout_message: Optional[str] = None,
+            initial_interval: float = POLL_INITIAL_INTERVAL,
+            max_interval: float = POLL_MAX_INTERVAL,
+            backoff: float = POLL_BACKOFF,
+            _light: bool = False
     ) -> bool:
         """
         Wait for custom condition to be true.
 
+        The condition is polled with jittered exponential backoff, so fast
+        conditions are seen within milliseconds while long waits settle at
+        max_interval between checks.
+
         Args:
             condition: Function that returns True when condition is met
             timeout: Maximum wait time in milliseconds
-            poll_interval: How often to check condition in seconds
             timeout_message: Custom timeout message
+            initial_interval: First sleep between checks in seconds
+            max_interval: Upper bound for the sleep between checks in seconds
+            backoff: Multiplier applied to the sleep after each failed check
+            _light: Skip the performance timer (internal, for hot callers)
 
         Returns:
             True when condition is met
@@ -145,28 +380,44 @@ class SmartWaiter:
             TimeoutException: If condition not met within timeout
         """
         timeout = timeout or self.default_timeout
-        timeout_seconds = timeout / 1000
-
-        start_time = time.time()
 
-        with get_performance_timer("wait_for_condition") as timer:
-            while time.time() - start_time < timeout_seconds:
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        start_ns = time.monotonic_ns()
+        deadline_ns = start_ns + int(timeout * 1_000_000)
+        interval = initial_interval
+        iterations = 0
+        condition_met = False
+
+        timer_context = nullcontext() if _light else get_performance_timer("wait_for_condition")
+        with timer_context as timer:
+            while True:
+                iterations += 1
                 try:
                     if condition():
-                        timer.add_metric("condition_met", True)
-                        timer.add_metric("wait_time", time.time() - start_time)
-                        return True
+                        condition_met = True
+                        break
                 except Exception as e:
                     # Log condition check errors but continue waiting
-                    self.logger.debug(f"Condition check failed: {e}")
-
-                time.sleep(poll_interval)
+                    if debug_enabled:
+                        self.logger.debug("Condition check failed: %s", e)
+
+                # Jittered backoff, never sleeping past the deadline
+                remaining_ns = deadline_ns - time.monotonic_ns()
+                if remaining_ns <= 0:
+                    break
+                time.sleep(min(interval * random.uniform(0.9, 1.1), remaining_ns / 1e9))
+                interval = min(interval * backoff, max_interval)
+
+            elapsed = (time.monotonic_ns() - start_ns) / 1e9
+            if timer is not None:
+                timer.add_metric("condition_met", condition_met)
+                timer.add_metric("wait_time", elapsed)
+                timer.add_metric("iterations", iterations)
+
+            if condition_met:
+                return True
 
             # Timeout reached
-            elapsed = time.time() - start_time
-            timer.add_metric("condition_met", False)
-            timer.add_metric("wait_time", elapsed)
-
             message = timeout_message or f"Custom condition not met within {elapsed:.2f}s"
             raise TimeoutException(
                 message,
@@ -178,53 +429,39 @@ class SmartWaiter:
             self,
             locator: Union[Locator, AsyncLocator],
             timeout: Optional[int] = None,
-            stability_duration: float = 0.5
+            stability_duration: float = 0.1,
+            min_samples: int = 3
     ) -> bool:
         """
         Wait for element to stop moving/animating.
 
+        The bounding box is sampled on every poll of wait_for_condition,
+        so stability and timeout share one clock instead of sleeping
+        inside the condition.
+
         Args:
             locator: Element locator
             timeout: Maximum wait time
             stability_duration: How long element must be stable
+            min_samples: Consecutive matching samples required
 
         Returns:
             True when element is stable
         """
         timeout = timeout or self.default_timeout
+        observe = _stability_tracker(stability_duration, min_samples)
 
         def is_stable() -> bool:
             try:
-                # Get element position
-                box = locator.bounding_box()
-                if not box:
-                    return False
-
-                # Wait for stability duration
-                time.sleep(stability_duration)
-
-                # Check if position changed
-                new_box = locator.bounding_box()
-                if not new_box:
-                    return False
-
-                # Compare positions (allow 1px tolerance)
-                position_stable = (
-                        abs(box['x'] - new_box['x']) <= 1 and
-                        abs(box['y'] - new_box['y']) <= 1 and
-                        abs(box['width'] - new_box['width']) <= 1 and
-                        abs(box['height'] - new_box['height']) <= 1
-                )
-
-                return position_stable
-
+                # One round-trip yields two rects taken a frame apart
+                sample = locator.evaluate(_STABILITY_JS)
             except Exception:
-                return False
+                sample = None
+            return observe(sample)
 
         return self.wait_for_condition(
             condition=is_stable,
             timeout=timeout,
-            poll_interval=0.1,
             timeout_message="Element did not stabilize"
         )
 
@@ -244,6 +481,7 @@ class SmartWaiter:
             True when network is idle
         """
         timeout = timeout or self.default_timeout
+        timeout_seconds = timeout / 1000
 
         try:
             self.page.wait_for_load_state("networkidle", timeout=timeout)
@@ -256,13 +494,13 @@ class SmartWaiter:
 
             return True
 
-        except Exception as e:
+        except PlaywrightTimeoutError as e:
             raise TimeoutException(
                 f"Network did not become idle within {timeout}ms",
-                timeout_duration=timeout / 1000,
+                timeout_duration=timeout_seconds,
                 operation_type="wait_for_network_idle",
                 original_exception=e
-            )
+            ) from e
 
     def wait_for_page_load_complete(
             self,
@@ -282,21 +520,21 @@ class SmartWaiter:
             True when page fully loaded
         """
         timeout = timeout or self.default_timeout
+        timeout_seconds = timeout / 1000
 
         with get_performance_timer("wait_for_page_load_complete") as timer:
             try:
-                # Wait for basic load events
-                self.page.wait_for_load_state("load", timeout=timeout)
-                self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+                # networkidle fires only after load (and therefore
+                # domcontentloaded), so one round-trip covers all three
                 self.page.wait_for_load_state("networkidle", timeout=timeout)
 
-                # Wait for fonts if requested
-                if wait_for_fonts:
-                    self._wait_for_fonts_loaded(timeout=5000)  # Shorter timeout for fonts
-
-                # Wait for images if requested
-                if wait_for_images:
-                    self._wait_for_images_loaded(timeout=10000)  # Timeout for images
+                # Fonts and images settle concurrently in one in-page
+                # Promise.all; fonts alone get the shorter timeout
+                self._wait_for_assets_loaded(
+                    wait_for_fonts,
+                    wait_for_images,
+                    timeout=10000 if wait_for_images else 5000
+                )
 
                 timer.add_metric("fonts_waited", wait_for_fonts)
                 timer.add_metric("images_waited", wait_for_images)
@@ -309,40 +547,38 @@ class SmartWaiter:
 
                 return True
 
-            except Exception as e:
+            except PlaywrightTimeoutError as e:
                 raise TimeoutException(
                     f"Page did not load completely within {timeout}ms",
-                    timeout_duration=timeout / 1000,
+                    timeout_duration=timeout_seconds,
                     operation_type="wait_for_page_load_complete",
                     original_exception=e
-                )
+                ) from e
+
+    def _wait_for_assets_loaded(
+            self,
+            wait_for_fonts: bool = True,
+            wait_for_images: bool = True,
+            timeout: int = 10000
+    ) -> None:
+        """Wait for web fonts and/or images to load in a single page round-trip."""
+        if not (wait_for_fonts or wait_for_images):
+            return
 
-    def _wait_for_fonts_loaded(self, timeout: int = 5000) -> None:
-        """Wait for web fonts to load."""
         try:
+            if self.page not in _ASSETS_READY_PAGES:
+                self.page.add_init_script(_ASSETS_INIT_JS)
+                self.page.evaluate(_ASSETS_INIT_JS)
+                _ASSETS_READY_PAGES.add(self.page)
+
             self.page.wait_for_function(
-                "document.fonts ? document.fonts.ready : Promise.resolve()",
+                _ASSETS_WAIT_JS,
+                arg=[wait_for_fonts, wait_for_images],
                 timeout=timeout
             )
         except Exception as e:
-            self.logger.debug(f"Font loading wait failed: {e}")
-            # Don't fail the test for font loading issues
-
-    def _wait_for_images_loaded(self, timeout: int = 10000) -> None:
-        """Wait for images to load."""
-        try:
-            # Wait for all images to have naturalWidth > 0 or failed to load
-            self.page.wait_for_function("""
-                () => {
-                    const images = Array.from(document.images);
-                    return images.length === 0 || images.every(img => 
-                        img.complete && (img.naturalWidth > 0 || img.src === '')
-                    );
-                }
-            """, timeout=timeout)
-        except Exception as e:
-            self.logger.debug(f"Image loading wait failed: {e}")
-            # Don't fail the test for image loading issues
+            self.logger.debug("Asset loading wait failed: %s", e)
+            # Don't fail the test for font/image loading issues
 
     def wait_for_element_count(
             self,
@@ -365,23 +601,17 @@ class SmartWaiter:
         """
         timeout = timeout or self.default_timeout
 
+        try:
+            compare = _COMPARATORS[comparison]
+        except KeyError:
+            raise ValueError(f"Invalid comparison: {comparison}") from None
+
+        # Resolve the locator once; each poll only asks for its count
+        locator = self._locator(selector)
+
         def check_count() -> bool:
             try:
-                actual_count = self.page.locator(selector).count()
-
-                if comparison == "equal":
-                    return actual_count == expected_count
-                elif comparison == "greater":
-                    return actual_count > expected_count
-                elif comparison == "less":
-                    return actual_count < expected_count
-                elif comparison == "greater_equal":
-                    return actual_count >= expected_count
-                elif comparison == "less_equal":
-                    return actual_count <= expected_count
-                else:
-                    raise ValueError(f"Invalid comparison: {comparison}")
-
+                return compare(locator.count(), expected_count)
             except Exception:
                 return False
 
@@ -413,6 +643,7 @@ class SmartWaiter:
             True when text appears
         """
         timeout = timeout or self.default_timeout
+        timeout_seconds = timeout / 1000
 
         try:
             if exact_match:
@@ -436,13 +667,13 @@ class SmartWaiter:
 
             return True
 
-        except Exception as e:
+        except AssertionError as e:
             raise TimeoutException(
                 f"Text '{expected_text}' did not appear within {timeout}ms",
-                timeout_duration=timeout / 1000,
+                timeout_duration=timeout_seconds,
                 operation_type="wait_for_text",
                 original_exception=e
-            )
+            ) from e
 
     def wait_for_text_to_disappear(
             self,
@@ -461,17 +692,10 @@ class SmartWaiter:
         Returns:
             True when text disappears
         """
-        timeout = timeout or self.default_timeout
-
-        def text_not_present() -> bool:
-            try:
-                current_text = locator.text_content() or ""
-                return text_to_disappear not in current_text
-            except Exception:
-                return True  # Element not found = text disappeared
-
+        # Re-queried on every check, so re-rendered or removed elements
+        # are seen as they are now; no matching element counts as gone
         return self.wait_for_condition(
-            condition=text_not_present,
+            lambda: locator.evaluate_all(_TEXT_GONE_JS, text_to_disappear),
             timeout=timeout,
             timeout_message=f"Text '{text_to_disappear}' did not disappear"
         )
@@ -496,6 +720,7 @@ class SmartWaiter:
             True when attribute has expected value
         """
         timeout = timeout or self.default_timeout
+        timeout_seconds = timeout / 1000
 
         try:
             expect(locator).to_have_attribute(
@@ -505,13 +730,13 @@ class SmartWaiter:
             )
             return True
 
-        except Exception as e:
+        except AssertionError as e:
             raise TimeoutException(
                 f"Attribute '{attribute_name}' did not have value '{expected_value}' within {timeout}ms",
-                timeout_duration=timeout / 1000,
+                timeout_duration=timeout_seconds,
                 operation_type="wait_for_attribute",
                 original_exception=e
-            )
+            ) from e
 
     def wait_for_css_class(
             self,
@@ -533,6 +758,7 @@ class SmartWaiter:
             True when class condition is met
         """
         timeout = timeout or self.default_timeout
+        timeout_seconds = timeout / 1000
 
         try:
             if should_have:
@@ -542,14 +768,14 @@ class SmartWaiter:
 
             return True
 
-        except Exception as e:
+        except AssertionError as e:
             action = "have" if should_have else "not have"
             raise TimeoutException(
                 f"Element did not {action} class '{class_name}' within {timeout}ms",
-                timeout_duration=timeout / 1000,
+                timeout_duration=timeout_seconds,
                 operation_type="wait_for_css_class",
                 original_exception=e
-            )
+            ) from e
 
     def wait_for_url_change(
             self,
@@ -567,27 +793,528 @@ class SmartWaiter:
             True when URL changes
         """
         timeout = timeout or self.default_timeout
-        current_url = self.page.url
+        timeout_seconds = timeout / 1000
+
+        try:
+            self.page.wait_for_function(
+                _URL_CHANGED_JS,
+                arg=[self.page.url, expected_url_fragment],
+                timeout=timeout
+            )
+            return True
+
+        except PlaywrightTimeoutError as e:
+            raise TimeoutException(
+                f"URL did not change within {timeout}ms",
+                timeout_duration=timeout_seconds,
+                operation_type="wait_for_url_change",
+                original_exception=e
+            ) from e
+
+
+class SyncSmartWaiter(SmartWaiter):
+    """Smart waiter for sync Playwright pages."""
+
+    page: Page
+
+
+class AsyncSmartWaiter(_WaiterBase):
+    """
+    Smart waiter for async Playwright pages.
+
+    Wait methods are coroutines and sleep with asyncio.sleep, so many
+    waiters can share one event loop thread.
+    """
+
+    page: AsyncPage
+
+    async def wait_for(
+            self,
+            condition_type: WaitCondition,
+            selector: str,
+            timeout: Optional[int] = None,
+            **kwargs
+    ) -> bool:
+        """Wait for a factory condition on the element matching selector."""
+        timeout = timeout or self.default_timeout
+
+        if condition_type == WaitCondition.STABLE:
+            return await self.wait_for_element_stable(self._locator(selector), timeout)
+        if condition_type == WaitCondition.COUNT:
+            return await self.wait_for_element_count(
+                selector, kwargs.get("count", 1), timeout, kwargs.get("comparison", "equal")
+            )
+
+        script = WaitConditionFactory.to_js_predicate(condition_type, selector, kwargs)
+        if script is not None:
+            try:
+                await self.page.wait_for_function(script, arg=[selector, kwargs], timeout=timeout)
+                return True
+
+            except PlaywrightTimeoutError as e:
+                raise TimeoutException(
+                    f"Condition '{condition_type}' not met for {selector} within {timeout}ms",
+                    timeout_duration=timeout / 1000,
+                    operation_type="wait_for",
+                    original_exception=e
+                ) from e
+
+            except PlaywrightError:
+                # The browser rejected the selector; retry through the locator
+                pass
+
+        locator = self._locator(selector)
+        element_script = _JS_ELEMENT_PREDICATES[condition_type]
+        return await self.wait_for_condition(
+            lambda: locator.evaluate_all(element_script, kwargs),
+            timeout=timeout,
+            timeout_message=f"Condition '{condition_type}' not met for {selector}"
+        )
+
+    async def wait_for_condition(
+            self,
+            condition: Callable[[], Union[bool, Awaitable[bool]]],
+            timeout: Optional[int] = None,
+            timeout_message: Optional[str] = None,
+            initial_interval: float = POLL_INITIAL_INTERVAL,
+            max_interval: float = POLL_MAX_INTERVAL,
+            backoff: float = POLL_BACKOFF,
+            _light: bool = False,
+            offload: bool = False
+    ) -> bool:
+        """
+        Wait for custom condition to be true.
+
+        The condition may return a bool or an awaitable.
+
+        Args:
+            condition: Function (sync or async) that returns True when met
+            timeout: Maximum wait time in milliseconds
+            timeout_message: Custom timeout message
+            initial_interval: First sleep between checks in seconds
+            max_interval: Upper bound for the sleep between checks in seconds
+            backoff: Multiplier applied to the sleep after each failed check
+            _light: Skip the performance timer (internal, for hot callers)
+            offload: Run a blocking sync condition in a worker thread
+
+        Returns:
+            True when condition is met
+
+        Raises:
+            TimeoutException: If condition not met within timeout
+        """
+        timeout = timeout or self.default_timeout
+
+        loop = asyncio.get_running_loop()
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        start_time = loop.time()
+        deadline = start_time + timeout / 1000
+        interval = initial_interval
+        iterations = 0
+        condition_met = False
+
+        timer_context = nullcontext() if _light else get_performance_timer("wait_for_condition")
+        with timer_context as timer:
+            while True:
+                iterations += 1
+                try:
+                    if offload:
+                        result = await asyncio.to_thread(condition)
+                    else:
+                        result = condition()
+                    if inspect.isawaitable(result):
+                        result = await result
+                    if result:
+                        condition_met = True
+                        break
+                except Exception as e:
+                    if debug_enabled:
+                        self.logger.debug("Condition check failed: %s", e)
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                await asyncio.sleep(min(interval * random.uniform(0.9, 1.1), remaining))
+                interval = min(interval * backoff, max_interval)
+
+            elapsed = loop.time() - start_time
+            if timer is not None:
+                timer.add_metric("condition_met", condition_met)
+                timer.add_metric("wait_time", elapsed)
+                timer.add_metric("iterations", iterations)
+
+            if condition_met:
+                return True
+
+            message = timeout_message or f"Custom condition not met within {elapsed:.2f}s"
+            raise TimeoutException(
+                message,
+                timeout_duration=elapsed,
+                operation_type="wait_for_condition"
+            )
+
+    async def wait_for_element_stable(
+            self,
+            locator: AsyncLocator,
+            timeout: Optional[int] = None,
+            stability_duration: float = 0.1,
+            min_samples: int = 3
+    ) -> bool:
+        """Wait for element to stop moving/animating."""
+        timeout = timeout or self.default_timeout
+        observe = _stability_tracker(stability_duration, min_samples)
+
+        async def is_stable() -> bool:
+            try:
+                sample = await locator.evaluate(_STABILITY_JS)
+            except Exception:
+                sample = None
+            return observe(sample)
+
+        return await self.wait_for_condition(
+            condition=is_stable,
+            timeout=timeout,
+            timeout_message="Element did not stabilize"
+        )
+
+    async def wait_for_network_idle(
+            self,
+            timeout: Optional[int] = None,
+            idle_time: int = 500
+    ) -> bool:
+        """Wait for network to be idle."""
+        timeout = timeout or self.default_timeout
+
+        try:
+            await self.page.wait_for_load_state("networkidle", timeout=timeout)
+            self.logger.debug(
+                "Network idle state reached",
+                timeout=timeout,
+                idle_time=idle_time
+            )
+            return True
+
+        except PlaywrightTimeoutError as e:
+            raise TimeoutException(
+                f"Network did not become idle within {timeout}ms",
+                timeout_duration=timeout / 1000,
+                operation_type="wait_for_network_idle",
+                original_exception=e
+            ) from e
+
+    async def wait_for_page_load_complete(
+            self,
+            timeout: Optional[int] = None,
+            wait_for_fonts: bool = True,
+            wait_for_images: bool = True
+    ) -> bool:
+        """Wait for complete page load including resources."""
+        timeout = timeout or self.default_timeout
+
+        with get_performance_timer("wait_for_page_load_complete") as timer:
+            try:
+                await self.page.wait_for_load_state("networkidle", timeout=timeout)
+                await self._wait_for_assets_loaded(
+                    wait_for_fonts,
+                    wait_for_images,
+                    timeout=10000 if wait_for_images else 5000
+                )
+
+                timer.add_metric("fonts_waited", wait_for_fonts)
+                timer.add_metric("images_waited", wait_for_images)
+                return True
+
+            except PlaywrightTimeoutError as e:
+                raise TimeoutException(
+                    f"Page did not load completely within {timeout}ms",
+                    timeout_duration=timeout / 1000,
+                    operation_type="wait_for_page_load_complete",
+                    original_exception=e
+                ) from e
+
+    async def _wait_for_assets_loaded(
+            self,
+            wait_for_fonts: bool = True,
+            wait_for_images: bool = True,
+            timeout: int = 10000
+    ) -> None:
+        """Wait for web fonts and/or images to load in a single page round-trip."""
+        if not (wait_for_fonts or wait_for_images):
+            return
+
+        try:
+            if self.page not in _ASSETS_READY_PAGES:
+                await self.page.add_init_script(_ASSETS_INIT_JS)
+                await self.page.evaluate(_ASSETS_INIT_JS)
+                _ASSETS_READY_PAGES.add(self.page)
+
+            await self.page.wait_for_function(
+                _ASSETS_WAIT_JS,
+                arg=[wait_for_fonts, wait_for_images],
+                timeout=timeout
+            )
+        except Exception as e:
+            self.logger.debug("Asset loading wait failed: %s", e)
+
+    async def wait_for_element_count(
+            self,
+            selector: str,
+            expected_count: int,
+            timeout: Optional[int] = None,
+            comparison: str = "equal"
+    ) -> bool:
+        """Wait for specific number of elements."""
+        timeout = timeout or self.default_timeout
+
+        try:
+            compare = _COMPARATORS[comparison]
+        except KeyError:
+            raise ValueError(f"Invalid comparison: {comparison}") from None
+
+        locator = self._locator(selector)
+
+        async def check_count() -> bool:
+            return compare(await locator.count(), expected_count)
+
+        return await self.wait_for_condition(
+            condition=check_count,
+            timeout=timeout,
+            timeout_message=f"Element count condition not met: {selector} {comparison} {expected_count}"
+        )
+
+    async def wait_for_text_to_appear(
+            self,
+            locator: AsyncLocator,
+            expected_text: str,
+            timeout: Optional[int] = None,
+            case_sensitive: bool = True,
+            exact_match: bool = False
+    ) -> bool:
+        """Wait for text to appear in element."""
+        timeout = timeout or self.default_timeout
 
-        def url_changed() -> bool:
-            new_url = self.page.url
-            if expected_url_fragment:
-                return expected_url_fragment in new_url
+        try:
+            assertions = async_expect(locator)
+            if exact_match:
+                await assertions.to_have_text(
+                    expected_text, timeout=timeout, ignore_case=not case_sensitive
+                )
             else:
-                return new_url != current_url
+                await assertions.to_contain_text(
+                    expected_text, timeout=timeout, ignore_case=not case_sensitive
+                )
+            return True
 
-        return self.wait_for_condition(
-            condition=url_changed,
+        except AssertionError as e:
+            raise TimeoutException(
+                f"Text '{expected_text}' did not appear within {timeout}ms",
+                timeout_duration=timeout / 1000,
+                operation_type="wait_for_text",
+                original_exception=e
+            ) from e
+
+    async def wait_for_text_to_disappear(
+            self,
+            locator: AsyncLocator,
+            text_to_disappear: str,
+            timeout: Optional[int] = None
+    ) -> bool:
+        """Wait for text to disappear from element."""
+        return await self.wait_for_condition(
+            lambda: locator.evaluate_all(_TEXT_GONE_JS, text_to_disappear),
             timeout=timeout,
-            timeout_message=f"URL did not change within {timeout}ms"
+            timeout_message=f"Text '{text_to_disappear}' did not disappear"
         )
 
+    async def wait_for_attribute_value(
+            self,
+            locator: AsyncLocator,
+            attribute_name: str,
+            expected_value: str,
+            timeout: Optional[int] = None
+    ) -> bool:
+        """Wait for element attribute to have specific value."""
+        timeout = timeout or self.default_timeout
+
+        try:
+            await async_expect(locator).to_have_attribute(
+                attribute_name,
+                expected_value,
+                timeout=timeout
+            )
+            return True
+
+        except AssertionError as e:
+            raise TimeoutException(
+                f"Attribute '{attribute_name}' did not have value '{expected_value}' within {timeout}ms",
+                timeout_duration=timeout / 1000,
+                operation_type="wait_for_attribute",
+                original_exception=e
+            ) from e
+
+    async def wait_for_css_class(
+            self,
+            locator: AsyncLocator,
+            class_name: str,
+            should_have: bool = True,
+            timeout: Optional[int] = None
+    ) -> bool:
+        """Wait for element to have or not have CSS class."""
+        timeout = timeout or self.default_timeout
+
+        try:
+            if should_have:
+                await async_expect(locator).to_have_class(class_name, timeout=timeout)
+            else:
+                await async_expect(locator).not_to_have_class(class_name, timeout=timeout)
+            return True
+
+        except AssertionError as e:
+            action = "have" if should_have else "not have"
+            raise TimeoutException(
+                f"Element did not {action} class '{class_name}' within {timeout}ms",
+                timeout_duration=timeout / 1000,
+                operation_type="wait_for_css_class",
+                original_exception=e
+            ) from e
+
+    async def wait_for_url_change(
+            self,
+            expected_url_fragment: Optional[str] = None,
+            timeout: Optional[int] = None
+    ) -> bool:
+        """Wait for URL to change."""
+        timeout = timeout or self.default_timeout
+
+        try:
+            await self.page.wait_for_function(
+                _URL_CHANGED_JS,
+                arg=[self.page.url, expected_url_fragment],
+                timeout=timeout
+            )
+            return True
+
+        except PlaywrightTimeoutError as e:
+            raise TimeoutException(
+                f"URL did not change within {timeout}ms",
+                timeout_duration=timeout / 1000,
+                operation_type="wait_for_url_change",
+                original_exception=e
+            ) from e
+
+
+def _expect_clickable(locator: Locator, kwargs: Dict[str, Any]) -> None:
+    expect(locator).to_be_visible(timeout=1000)
+    expect(locator).to_be_enabled(timeout=1000)
+
+
+def _expect_attribute(locator: Locator, kwargs: Dict[str, Any]) -> None:
+    attr_name = kwargs.get('attribute_name', '')
+    attr_value = kwargs.get('attribute_value')
+    if attr_value is not None:
+        expect(locator).to_have_attribute(attr_name, attr_value, timeout=1000)
+    else:
+        expect(locator).to_have_attribute(attr_name, timeout=1000)
+
+
+# Expectation run by each factory-built condition; raising means "not met"
+_COND_DISPATCH: Dict[WaitCondition, Callable[[Locator, Dict[str, Any]], None]] = {
+    WaitCondition.VISIBLE: lambda loc, kw: expect(loc).to_be_visible(timeout=1000),
+    WaitCondition.ATTACHED: lambda loc, kw: expect(loc).to_be_attached(timeout=1000),
+    WaitCondition.DETACHED: lambda loc, kw: expect(loc).to_be_detached(timeout=1000),
+    WaitCondition.ENABLED: lambda loc, kw: expect(loc).to_be_enabled(timeout=1000),
+    WaitCondition.DISABLED: lambda loc, kw: expect(loc).to_be_disabled(timeout=1000),
+    WaitCondition.CLICKABLE: _expect_clickable,
+    WaitCondition.EDITABLE: lambda loc, kw: expect(loc).to_be_editable(timeout=1000),
+    WaitCondition.HIDDEN: lambda loc, kw: expect(loc).to_be_hidden(timeout=1000),
+    WaitCondition.HAS_TEXT: lambda loc, kw: expect(loc).to_contain_text(
+        kw.get('text', ''), timeout=1000
+    ),
+    WaitCondition.HAS_VALUE: lambda loc, kw: expect(loc).to_have_value(
+        kw.get('value', ''), timeout=1000
+    ),
+    WaitCondition.HAS_CLASS: lambda loc, kw: expect(loc).to_have_class(
+        kw.get('class_name', ''), timeout=1000
+    ),
+    WaitCondition.HAS_ATTRIBUTE: _expect_attribute,
+}
+
+
+# Browser-side checks for the factory conditions, written against the first
+# matching element `el` (possibly undefined) and the condition kwargs `kw`
+_JS_CONDITION_BODIES: Dict[WaitCondition, str] = {
+    WaitCondition.VISIBLE: (
+        "!!el && el.getClientRects().length > 0"
+        " && getComputedStyle(el).visibility !== 'hidden'"
+    ),
+    WaitCondition.HIDDEN: (
+        "!el || el.getClientRects().length === 0"
+        " || getComputedStyle(el).visibility === 'hidden'"
+    ),
+    WaitCondition.ATTACHED: "!!el",
+    WaitCondition.DETACHED: "!el",
+    WaitCondition.ENABLED: "!!el && !el.disabled",
+    WaitCondition.DISABLED: "!!el && !!el.disabled",
+    WaitCondition.CLICKABLE: (
+        "!!el && !el.disabled && el.getClientRects().length > 0"
+        " && getComputedStyle(el).visibility !== 'hidden'"
+    ),
+    WaitCondition.EDITABLE: "!!el && !el.disabled && !el.readOnly",
+    WaitCondition.HAS_TEXT: "!!el && (el.textContent || '').includes(kw.text || '')",
+    WaitCondition.HAS_VALUE: "!!el && el.value === (kw.value || '')",
+    WaitCondition.HAS_CLASS: "!!el && el.getAttribute('class') === (kw.class_name || '')",
+    WaitCondition.HAS_ATTRIBUTE: (
+        "!!el && (kw.attribute_value == null"
+        " ? el.hasAttribute(kw.attribute_name)"
+        " : el.getAttribute(kw.attribute_name) === kw.attribute_value)"
+    ),
+}
+
+# First match for `sel`, searching open shadow roots like Playwright's CSS engine
+_JS_DEEP_QUERY = (
+    "const find = (root) => { const hit = root.querySelector(sel); if (hit) return hit;"
+    " for (const host of root.querySelectorAll('*')) { if (host.shadowRoot) {"
+    " const inner = find(host.shadowRoot); if (inner) return inner; } }"
+    " return null; };"
+)
+
+# Page-level predicates (CSS selectors) for wait_for_function([selector, kwargs])
+_JS_PREDICATES: Dict[WaitCondition, str] = {
+    condition: f"([sel, kw]) => {{ {_JS_DEEP_QUERY} const el = find(document); return {body}; }}"
+    for condition, body in _JS_CONDITION_BODIES.items()
+}
+
+# Element-level predicates for locator.evaluate_all(kwargs), any selector engine
+_JS_ELEMENT_PREDICATES: Dict[WaitCondition, str] = {
+    condition: f"(els, kw) => {{ const el = els[0]; return {body}; }}"
+    for condition, body in _JS_CONDITION_BODIES.items()
+}
+
+# Plain CSS that document.querySelector runs the same way Playwright does:
+# tag/#id/.class/[attr] compounds joined by descendant, >, + or ~ combinators.
+# Anything else (XPath, text, engine prefixes, pseudo-classes) goes through
+# the locator instead.
+_CSS_IDENT = r"-?[_a-zA-Z][\w-]*"
+_CSS_ATTRIBUTE = rf"\[\s*{_CSS_IDENT}\s*(?:[~|^$*]?=\s*(?:{_CSS_IDENT}|\"[^\"\\]*\"|'[^'\\]*')\s*)?\]"
+_CSS_COMPOUND = (
+    rf"(?:(?:{_CSS_IDENT}|\*)(?:#{_CSS_IDENT}|\.{_CSS_IDENT}|{_CSS_ATTRIBUTE})*"
+    rf"|(?:#{_CSS_IDENT}|\.{_CSS_IDENT}|{_CSS_ATTRIBUTE})+)"
+)
+_SIMPLE_CSS_SELECTOR = re.compile(
+    rf"\s*{_CSS_COMPOUND}(?:(?:\s*[>+~]\s*|\s+){_CSS_COMPOUND})*\s*"
+)
+
 
 class WaitConditionFactory:
     """Factory for creating custom wait conditions."""
 
-    @staticmethod
+    # Condition functions by (condition_type, locator id, kwargs); entries
+    # drop out once no caller holds the function any more
+    _condition_cache: "WeakValueDictionary[tuple, Callable[[], bool]]" = WeakValueDictionary()
+
+    @classmethod
     def create_wait_condition(
+            cls,
             condition_type: WaitCondition,
             locator: Union[Locator, AsyncLocator],
             **kwargs
@@ -595,6 +1322,9 @@ class WaitConditionFactory:
         """
         Create wait condition function.
 
+        Identical requests for the same locator return the same function
+        object while it is still referenced.
+
         Args:
             condition_type: Type of condition to create
             locator: Element locator
@@ -603,57 +1333,59 @@ class WaitConditionFactory:
         Returns:
             Condition function
         """
+        try:
+            key = (condition_type, id(locator), frozenset(kwargs.items()))
+            condition_func = cls._condition_cache.get(key)
+        except TypeError:
+            # Unhashable kwargs values: build without caching
+            return cls._build_wait_condition(condition_type, locator, kwargs)
+
+        if condition_func is None:
+            condition_func = cls._build_wait_condition(condition_type, locator, kwargs)
+            cls._condition_cache[key] = condition_func
+
+        return condition_func
+
+    @staticmethod
+    def to_js_predicate(
+            condition_type: WaitCondition,
+            selector: str,
+            kwargs: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """
+        Get a browser-side predicate for the condition, if one exists.
+
+        The predicate is called with [selector, kwargs]. None means the
+        selector is not plain CSS or the condition has no browser-side check.
+
+        Args:
+            condition_type: Type of condition
+            selector: Element selector (plain CSS only)
+            kwargs: Additional parameters for condition
+
+        Returns:
+            JS function source or None
+        """
+        if not _SIMPLE_CSS_SELECTOR.fullmatch(_normalize_selector(selector)):
+            return None
+        return _JS_PREDICATES.get(condition_type)
+
+    @staticmethod
+    def _build_wait_condition(
+            condition_type: WaitCondition,
+            locator: Union[Locator, AsyncLocator],
+            kwargs: Dict[str, Any]
+    ) -> Callable[[], bool]:
+        """Build a new wait condition function."""
+        # Resolve the check once; polling the closure is then a single call
+        check = _COND_DISPATCH.get(condition_type)
 
         def condition_func() -> bool:
+            if check is None:
+                return False
             try:
-                if condition_type == WaitCondition.VISIBLE:
-                    expect(locator).to_be_visible(timeout=1000)
-                    return True
-                elif condition_type == WaitCondition.ATTACHED:
-                    expect(locator).to_be_attached(timeout=1000)
-                    return True
-                elif condition_type == WaitCondition.DETACHED:
-                    expect(locator).to_be_detached(timeout=1000)
-                    return True
-                elif condition_type == WaitCondition.ENABLED:
-                    expect(locator).to_be_enabled(timeout=1000)
-                    return True
-                elif condition_type == WaitCondition.DISABLED:
-                    expect(locator).to_be_disabled(timeout=1000)
-                    return True
-                elif condition_type == WaitCondition.CLICKABLE:
-                    expect(locator).to_be_visible(timeout=1000)
-                    expect(locator).to_be_enabled(timeout=1000)
-                    return True
-                elif condition_type == WaitCondition.EDITABLE:
-                    expect(locator).to_be_editable(timeout=1000)
-                    return True
-                elif condition_type == WaitCondition.HIDDEN:
-                    expect(locator).to_be_hidden(timeout=1000)
-                    return True
-                elif condition_type == WaitCondition.HAS_TEXT:
-                    expected_text = kwargs.get('text', '')
-                    expect(locator).to_contain_text(expected_text, timeout=1000)
-                    return True
-                elif condition_type == WaitCondition.HAS_VALUE:
-                    expected_value = kwargs.get('value', '')
-                    expect(locator).to_have_value(expected_value, timeout=1000)
-                    return True
-                elif condition_type == WaitCondition.HAS_CLASS:
-                    expected_class = kwargs.get('class_name', '')
-                    expect(locator).to_have_class(expected_class, timeout=1000)
-                    return True
-                elif condition_type == WaitCondition.HAS_ATTRIBUTE:
-                    attr_name = kwargs.get('attribute_name', '')
-                    attr_value = kwargs.get('attribute_value')
-                    if attr_value is not None:
-                        expect(locator).to_have_attribute(attr_name, attr_value, timeout=1000)
-                    else:
-                        expect(locator).to_have_attribute(attr_name, timeout=1000)
-                    return True
-                else:
-                    return False
-
+                check(locator, kwargs)
+                return True
             except Exception:
                 return False
 
@@ -661,6 +1393,20 @@ class WaitConditionFactory:
 
 
 # Convenience functions for common wait operations
+_WAITERS: "WeakKeyDictionary[Any, Union[SmartWaiter, AsyncSmartWaiter]]" = WeakKeyDictionary()
+
+
+def _waiter_for(page: Union[Page, AsyncPage]) -> Union[SmartWaiter, AsyncSmartWaiter]:
+    """Get the SmartWaiter for page, creating it once per page."""
+    try:
+        return _WAITERS[page]
+    except KeyError:
+        waiter = _WAITERS[page] = SmartWaiter(page)
+        # The waiter holds the page, so the weak key alone never expires
+        page.on("close", lambda closed: _WAITERS.pop(closed, None))
+        return waiter
+
+
 def create_wait_condition(
         condition_type: WaitCondition,
         locator: Union[Locator, AsyncLocator],
@@ -674,11 +1420,10 @@ def wait_for_element_stable(
         page: Union[Page, AsyncPage],
         locator: Union[Locator, AsyncLocator],
         timeout: Optional[int] = None,
-        stability_duration: float = 0.5
+        stability_duration: float = 0.1
 ) -> bool:
     """Wait for element to be stable (convenience function)."""
-    waiter = SmartWaiter(page)
-    return waiter.wait_for_element_stable(locator, timeout, stability_duration)
+    return _waiter_for(page).wait_for_element_stable(locator, timeout, stability_duration)
 
 
 def wait_for_network_idle(
@@ -687,8 +1432,7 @@ def wait_for_network_idle(
         idle_time: int = 500
 ) -> bool:
     """Wait for network idle (convenience function)."""
-    waiter = SmartWaiter(page)
-    return waiter.wait_for_network_idle(timeout, idle_time)
+    return _waiter_for(page).wait_for_network_idle(timeout, idle_time)
 
 
 def wait_for_page_load_complete(
@@ -698,59 +1442,89 @@ def wait_for_page_load_complete(
         wait_for_images: bool = True
 ) -> bool:
     """Wait for complete page load (convenience function)."""
-    waiter = SmartWaiter(page)
-    return waiter.wait_for_page_load_complete(timeout, wait_for_fonts, wait_for_images)
+    return _waiter_for(page).wait_for_page_load_complete(timeout, wait_for_fonts, wait_for_images)
 
 
 def wait_with_retry(
         condition: Callable[[], bool],
         max_retries: int = 3,
         retry_delay: float = 1.0,
-        timeout_per_retry: int = 10000
+        timeout_per_retry: int = 10000,
+        retry_delay_step: float = 0.5,
+        max_retry_delay: float = 5.0
 ) -> bool:
     """
     Wait for condition with retry logic.
 
+    The delay between attempts grows linearly from retry_delay by
+    retry_delay_step per attempt, capped at max_retry_delay and jittered.
+
     Args:
         condition: Condition function to wait for
         max_retries: Maximum number of retries
-        retry_delay: Delay between retries in seconds
+        retry_delay: Delay before the first retry in seconds
         timeout_per_retry: Timeout for each retry attempt
+        retry_delay_step: Delay added per further retry in seconds
+        max_retry_delay: Upper bound for the delay between retries
 
     Returns:
         True if condition met within retries
 
     Raises:
         TimeoutException: If condition not met after all retries
+        AutomationException: If the condition raised an error whose
+            severity does not allow retrying
     """
     logger = get_logger("wait_with_retry")
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    def backoff_delay(attempt: int) -> float:
+        delay = min(retry_delay + attempt * retry_delay_step, max_retry_delay)
+        return delay * random.uniform(0.8, 1.2)
 
     for attempt in range(max_retries + 1):  # +1 for initial attempt
         try:
-            start_time = time.time()
+            start_ns = time.monotonic_ns()
+            deadline_ns = start_ns + int(timeout_per_retry * 1_000_000)
+            interval = POLL_INITIAL_INTERVAL
 
-            # Poll condition with timeout
-            while time.time() - start_time < timeout_per_retry / 1000:
+            # Poll condition with timeout, backing off between checks
+            while True:
                 if condition():
-                    logger.debug(
-                        f"Wait condition met on attempt {attempt + 1}",
-                        attempt=attempt + 1,
-                        elapsed=time.time() - start_time
-                    )
+                    if debug_enabled:
+                        logger.debug(
+                            "Wait condition met on attempt %d",
+                            attempt + 1,
+                            attempt=attempt + 1,
+                            elapsed=(time.monotonic_ns() - start_ns) / 1e9
+                        )
                     return True
-                time.sleep(0.1)  # Poll interval
+
+                remaining_ns = deadline_ns - time.monotonic_ns()
+                if remaining_ns <= 0:
+                    break
+                time.sleep(min(interval * random.uniform(0.9, 1.1), remaining_ns / 1e9))
+                interval = min(interval * POLL_BACKOFF, POLL_MAX_INTERVAL)
 
             # Timeout reached for this attempt
             if attempt < max_retries:
-                logger.debug(
-                    f"Wait attempt {attempt + 1} timed out, retrying after {retry_delay}s"
-                )
-                time.sleep(retry_delay)
+                delay = backoff_delay(attempt)
+                if debug_enabled:
+                    logger.debug(
+                        "Wait attempt %d timed out, retrying after %.2fs",
+                        attempt + 1, delay
+                    )
+                time.sleep(delay)
 
         except Exception as e:
-            logger.debug(f"Wait attempt {attempt + 1} failed with error: {e}")
+            # Errors that will not recover are raised instead of retried
+            severity = getattr(e, "severity", None)
+            if isinstance(severity, ErrorSeverity) and not severity.should_retry():
+                raise
+            if debug_enabled:
+                logger.debug("Wait attempt %d failed with error: %s", attempt + 1, e)
             if attempt < max_retries:
-                time.sleep(retry_delay)
+                time.sleep(backoff_delay(attempt))
 
     # All retries exhausted
     raise TimeoutException(
@@ -760,6 +1534,14 @@ def wait_with_retry(
     )
 
 
+def _condition_met(condition: Callable[[], bool]) -> bool:
+    """Check condition once, treating errors as not met."""
+    try:
+        return bool(condition())
+    except Exception:
+        return False
+
+
 # Decorator for adding smart waiting to functions
 def with_smart_wait(
         wait_before: Optional[Callable[[], bool]] = None,
@@ -769,6 +1551,9 @@ def with_smart_wait(
     """
     Decorator to add smart waiting before/after function execution.
 
+    Only sync page objects are supported; with async pages await
+    AsyncSmartWaiter.wait_for_condition() directly instead.
+
     Args:
         wait_before: Condition to wait for before execution
         wait_after: Condition to wait for after execution
@@ -776,33 +1561,43 @@ def with_smart_wait(
 
     Returns:
         Decorated function
+
+    Raises:
+        TypeError: If used on a coroutine function or an async page
     """
 
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            raise TypeError(f"with_smart_wait does not support coroutine function {func.__name__}")
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            logger = get_logger(f"smart_wait.{func.__name__}")
+            if isinstance(args[0].page, AsyncPage):
+                raise TypeError(f"with_smart_wait does not support async pages ({func.__name__})")
+            waiter = None
 
-            # Wait before execution
-            if wait_before:
+            # Wait before execution, skipping the poll when already satisfied
+            if wait_before and not _condition_met(wait_before):
+                waiter = _waiter_for(args[0].page)
                 try:
-                    SmartWaiter(args[0].page).wait_for_condition(
-                        wait_before, timeout
-                    )
+                    waiter.wait_for_condition(wait_before, timeout, _light=True)
                 except Exception as e:
-                    logger.warning(f"Pre-execution wait failed: {e}")
+                    get_logger(f"smart_wait.{func.__name__}").warning(
+                        "Pre-execution wait failed: %s", e
+                    )
 
             # Execute function
             result = func(*args, **kwargs)
 
             # Wait after execution
-            if wait_after:
+            if wait_after and not _condition_met(wait_after):
+                waiter = waiter or _waiter_for(args[0].page)
                 try:
-                    SmartWaiter(args[0].page).wait_for_condition(
-                        wait_after, timeout
-                    )
+                    waiter.wait_for_condition(wait_after, timeout, _light=True)
                 except Exception as e:
-                    logger.warning(f"Post-execution wait failed: {e}")
+                    get_logger(f"smart_wait.{func.__name__}").warning(
+                        "Post-execution wait failed: %s", e
+                    )
 
             return result
 
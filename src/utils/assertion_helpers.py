@@ -20,26 +20,186 @@ Interview Highlights:
 - Performance-conscious assertion design
 """
 
+import itertools
+import logging
+import operator
 import re
 import time
-from typing import Any, Dict, List, Optional, Union, Callable, Pattern
+from collections import Counter
+from typing import AbstractSet, Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union, Pattern
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache, wraps
+from weakref import WeakSet, finalize
 
 from playwright.sync_api import Page, Locator, expect
 from playwright.async_api import Page as AsyncPage, Locator as AsyncLocator
 
 from src.config.settings import get_settings
 from src.core.exceptions.enums import ErrorSeverity
-from src.core.logger import get_logger, log_assertion
+from src.core.logger import get_logger, log_assertion, log_assertion_batch
 from src.core.exceptions import (
-    AutomationException,
     ElementException,
     TestAssertionException
 )
 
+# Patterns used by CustomMatchers, compiled once at import; the numeric
+# ones are ASCII-only so \d means [0-9]
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_RE = re.compile(r'^\+?[\d\s\-\(\)]{10,}$', re.ASCII)
+_PRICE_RE = re.compile(r'^\$?\d+\.?\d{0,2}$', re.ASCII)
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$')
+_CC_STRIP_RE = re.compile(r'[\s-]')
+_SOCK_SIZES_RE = re.compile(r'\b(?:XXL|XL|XS|S|M|L)\b', re.IGNORECASE)
+# ASCII digits only: _luhn_valid indexes by code point
+_CC_DIGITS_RE = re.compile(r'^\d{13,19}$', re.ASCII)
+# Luhn digit sums for a doubled digit, indexed by the digit
+_LUHN_DOUBLE = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+# Playwright's expect() failure message ends with "Actual value: ..." and an optional call log
+_ACTUAL_VALUE_RE = re.compile(r'\nActual value: (.*?) ?(?:\nCall log:|\Z)', re.S)
+
+# Failures are stamped with the monotonic clock; this pair maps them back to wall time
+_WALL_CLOCK_ANCHOR = time.time()
+_MONOTONIC_ANCHOR = time.monotonic_ns()
+
+_SCREENSHOTS_DIR = Path("reports/screenshots")
+_SHOT_COUNTER = itertools.count(1)
+# Severity order and labels for the assert_all summary, most severe first
+_SEVERITY_SUMMARY_LABELS = (
+    (ErrorSeverity.CRITICAL, "Critical failures"),
+    (ErrorSeverity.HIGH, "High severity failures"),
+    (ErrorSeverity.MEDIUM, "Medium severity failures"),
+    (ErrorSeverity.LOW, "Low severity failures"),
+)
+
+# Simple SoftAssertions checks: assertion type -> (predicate(actual, expected),
+# expected description format or None for the raw value, default failure
+# message format, screenshot name)
+_SOFT_COMPARISONS = {
+    "equal": (operator.eq, None,
+              "Expected {expected}, but got {actual}", "assertion_equal_failure"),
+    "not_equal": (operator.ne, "not {expected}",
+                  "Expected {actual} to not equal {expected}", "assertion_not_equal_failure"),
+    "contains": (operator.contains, "contains {expected}",
+                 "Expected '{actual}' to contain '{expected}'", "assertion_contains_failure"),
+    "not_contains": (lambda container, item: item not in container, "not contains {expected}",
+                     "Expected '{actual}' to not contain '{expected}'", "assertion_not_contains_failure"),
+    "greater_than": (operator.gt, "> {expected}",
+                     "Expected {actual} to be greater than {expected}", "assertion_greater_failure"),
+    "less_than": (operator.lt, "< {expected}",
+                  "Expected {actual} to be less than {expected}", "assertion_less_failure"),
+    "true": (operator.is_, None,
+             "Expected condition to be True, but got {actual}", "assertion_true_failure"),
+    "false": (operator.is_, None,
+              "Expected condition to be False, but got {actual}", "assertion_false_failure"),
+    "none": (operator.is_, None,
+             "Expected None, but got {actual}", "assertion_none_failure"),
+    "not_none": (operator.is_not, "not {expected}",
+                 "Expected value to not be None", "assertion_not_none_failure"),
+}
+
+# Page-side helpers for PerformanceAssertions, installed once per page so each
+# snapshot ships a one-line call instead of the measuring code.
+# Resource requests are counted by a PerformanceObserver rather than copying
+# the resource buffer; the count is seeded from the current buffer so it is
+# right when installed after load. Navigation Timing Level 2: the entry's
+# duration is loadEventEnd relative to its startTime.
+_PERF_INIT_JS = """
+(() => {
+    if (window.__perf) return;
+    const perf = window.__perf = {
+        requests: performance.getEntriesByType('resource').length,
+        nav: null,
+        loadMs: () => {
+            // A document has one navigation entry; keep it once loading has finished
+            if (!perf.nav || !perf.nav.loadEventEnd) {
+                perf.nav = performance.getEntriesByType('navigation')[0] || null;
+            }
+            return perf.nav ? perf.nav.duration : 0;
+        },
+        snapshot: () => ({ load: perf.loadMs(), reqs: perf.requests })
+    };
+    new PerformanceObserver(list => { perf.requests += list.getEntries().length; })
+        .observe({ type: 'resource' });
+})()
+"""
+_PERF_SNAPSHOT_JS = "() => window.__perf.snapshot()"
+# Pages that already have the performance helpers installed
+_PERF_READY_PAGES: "WeakSet[Any]" = WeakSet()
+
+_SCREENSHOT_WRITER: Optional[ThreadPoolExecutor] = None
+
+
+@lru_cache(maxsize=None)
+def _logger(name: str):
+    """Get a named logger, looked up once and shared by all assertion instances."""
+    return get_logger(name)
+
+
+def _flush_records(records: List[Tuple[str, Any, Any, bool]]) -> None:
+    """Log buffered assertion results as one batch and empty the buffer."""
+    if records:
+        batch = records[:]
+        records.clear()
+        log_assertion_batch(batch)
+
+
+def _screenshot_writer() -> ThreadPoolExecutor:
+    """Get the shared pool that writes screenshot files, created on first use."""
+    global _SCREENSHOT_WRITER
+    if _SCREENSHOT_WRITER is None:
+        _SCREENSHOT_WRITER = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="screenshot-writer"
+        )
+    return _SCREENSHOT_WRITER
 
-@dataclass
+
+def _no_screenshot(name: str, failure: "AssertionFailure") -> None:
+    """Stand-in for SoftAssertions._capture_screenshot when nothing can be captured."""
+    return None
+
+
+@lru_cache(maxsize=512)
+def _compile_pattern(pattern: str, flags: int = 0) -> Pattern:
+    """Compile a user-supplied pattern, memoized by (pattern, flags)."""
+    return re.compile(pattern, flags)
+
+
+def _clip_str(value: Any, limit: int) -> str:
+    """String form of a value, cut to limit characters for failure reports."""
+    text = str(value)
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}... ({len(text)} chars)"
+
+
+def _luhn_valid(card_num: str) -> bool:
+    """Luhn checksum of a string of ASCII digits."""
+    checksum = 0
+    for i, ch in enumerate(reversed(card_num)):
+        d = ord(ch) - 48
+        checksum += _LUHN_DOUBLE[d] if i & 1 else d
+    return checksum % 10 == 0
+
+
+def _actual_from_failure(error: BaseException) -> str:
+    """
+    Get the actual value Playwright reported for a failed expect() call.
+
+    Reads ``matcher_result`` when the error carries one and otherwise the
+    "Actual value" line of the message, so failure reporting does not need
+    another round-trip to the browser.
+    """
+    matcher_result = getattr(error, "matcher_result", None)
+    if isinstance(matcher_result, dict):
+        actual = matcher_result.get("actual")
+        return "" if actual is None else str(actual)
+    match = _ACTUAL_VALUE_RE.search(str(error))
+    return match.group(1) if match else ""
+
+
+@dataclass(slots=True)
 class AssertionFailure:
     """Details about a single assertion failure."""
 
@@ -47,19 +207,32 @@ class AssertionFailure:
     expected: Any
     actual: Any
     assertion_type: str
-    timestamp: float = field(default_factory=time.time)
+    timestamp: int = field(default_factory=time.monotonic_ns)  # monotonic ns; see wall_time
     context: Dict[str, Any] = field(default_factory=dict)
     severity: ErrorSeverity = ErrorSeverity.MEDIUM
     screenshot_path: Optional[str] = None
+    # String forms of expected/actual, captured once when the failure is created
+    expected_str: str = field(init=False, repr=False)
+    actual_str: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        limit = get_settings().logging.max_repr_len
+        self.expected_str = _clip_str(self.expected, limit)
+        self.actual_str = _clip_str(self.actual, limit)
+
+    @property
+    def wall_time(self) -> float:
+        """Wall-clock time of the failure in epoch seconds."""
+        return _WALL_CLOCK_ANCHOR + (self.timestamp - _MONOTONIC_ANCHOR) / 1e9
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert failure to dictionary for reporting."""
         return {
             "message": self.message,
-            "expected": str(self.expected),
-            "actual": str(self.actual),
+            "expected": self.expected_str,
+            "actual": self.actual_str,
             "assertion_type": self.assertion_type,
-            "timestamp": self.timestamp,
+            "timestamp": self.wall_time,
             "context": self.context,
             "severity": self.severity.value,
             "screenshot_path": self.screenshot_path
@@ -72,6 +245,9 @@ class SoftAssertions:
 
     This class collects assertion failures without immediately failing
     the test, allowing comprehensive validation of multiple conditions.
+    Assertion results are logged as one batch when assert_all() runs, the
+    context manager exits, has_failures()/get_failures() is called, or the
+    instance is garbage collected, so unchecked instances still log.
     """
 
     def __init__(self, page: Optional[Union[Page, AsyncPage]] = None):
@@ -83,9 +259,34 @@ class SoftAssertions:
         """
         self.page = page
         self.failures: List[AssertionFailure] = []
-        self.logger = get_logger("soft_assertions")
+        # Bound once per list; clear_failures rebinds it with the new list
+        self._append_failure = self.failures.append
+        self.logger = _logger("soft_assertions")
         self.settings = get_settings()
 
+        # Passing assertions are logged at INFO; skip building those records
+        # entirely when that level is off
+        self._log_passes = _logger("assertions").isEnabledFor(logging.INFO)
+        # Results are logged as one batch event; the buffer is only ever
+        # drained in place so the finalizer below can share it
+        self._log_buffer: List[Tuple[str, Any, Any, bool]] = []
+        finalize(self, _flush_records, self._log_buffer)
+
+        # Failure screenshots follow the browser screenshot mode, read once;
+        # without a page or with screenshots off, failures skip capture entirely
+        self._screenshot_on_failure = self.settings.browser.screenshot_mode != "off"
+        if page is None or not self._screenshot_on_failure:
+            self._capture_screenshot = _no_screenshot
+
+        # Screenshot location is resolved once; names are made unique with
+        # the creation time plus a process-wide counter
+        self._screenshots_dir = _SCREENSHOTS_DIR
+        self._shot_stamp = time.strftime("%Y%m%d_%H%M%S")
+        if page is not None:
+            self._screenshots_dir.mkdir(parents=True, exist_ok=True)
+        # Screenshot writes still in flight, with the failure pointing at each file
+        self._pending_screenshots: List[Tuple[Future, AssertionFailure]] = []
+
     def assert_equal(
             self,
             actual: Any,
@@ -105,34 +306,15 @@ class SoftAssertions:
         Returns:
             Self for method chaining
         """
-        passed = actual == expected
-
-        if not passed:
-            failure_message = message or f"Expected {expected}, but got {actual}"
-            screenshot_path = self._capture_screenshot("assertion_equal_failure")
-
-            failure = AssertionFailure(
-                message=failure_message,
-                expected=expected,
-                actual=actual,
-                assertion_type="equal",
-                severity=severity,
-                screenshot_path=screenshot_path
-            )
-
-            self.failures.append(failure)
-
+        if not self._compare("equal", actual, expected, message, severity):
             self.logger.warning(
                 "Soft assertion failed",
                 assertion_type="equal",
                 expected=expected,
                 actual=actual,
-                message=failure_message
+                message=self.failures[-1].message
             )
 
-        # Log assertion result
-        log_assertion("equal", expected, actual, passed)
-
         return self
 
     def assert_not_equal(
@@ -143,54 +325,36 @@ class SoftAssertions:
             severity: ErrorSeverity = ErrorSeverity.MEDIUM
     ) -> "SoftAssertions":
         """Assert two values are not equal."""
-        passed = actual != expected
-
-        if not passed:
-            failure_message = message or f"Expected {actual} to not equal {expected}"
-            screenshot_path = self._capture_screenshot("assertion_not_equal_failure")
-
-            failure = AssertionFailure(
-                message=failure_message,
-                expected=f"not {expected}",
-                actual=actual,
-                assertion_type="not_equal",
-                severity=severity,
-                screenshot_path=screenshot_path
-            )
-
-            self.failures.append(failure)
-
-        log_assertion("not_equal", f"not {expected}", actual, passed)
+        self._compare("not_equal", actual, expected, message, severity)
         return self
 
     def assert_contains(
             self,
-            container: Union[str, List, Dict],
+            container: Union[str, List, Dict, AbstractSet],
             item: Any,
             message: Optional[str] = None,
             severity: ErrorSeverity = ErrorSeverity.MEDIUM
     ) -> "SoftAssertions":
-        """Assert container contains item."""
-        passed = item in container
-
-        if not passed:
-            failure_message = message or f"Expected '{container}' to contain '{item}'"
-            screenshot_path = self._capture_screenshot("assertion_contains_failure")
-
-            failure = AssertionFailure(
-                message=failure_message,
-                expected=f"contains {item}",
-                actual=container,
-                assertion_type="contains",
-                severity=severity,
-                screenshot_path=screenshot_path
-            )
-
-            self.failures.append(failure)
+        """
+        Assert container contains item.
 
-        log_assertion("contains", f"contains {item}", container, passed)
+        Membership in a list is a linear scan; when checking many items
+        against the same large collection, build a set once and use
+        assert_in_set.
+        """
+        self._compare("contains", container, item, message, severity)
         return self
 
+    def assert_in_set(
+            self,
+            item: Any,
+            container: AbstractSet,
+            message: Optional[str] = None,
+            severity: ErrorSeverity = ErrorSeverity.MEDIUM
+    ) -> "SoftAssertions":
+        """Assert item is in a prebuilt set (hash lookup instead of a scan)."""
+        return self.assert_contains(container, item, message, severity)
+
     def assert_not_contains(
             self,
             container: Union[str, List, Dict],
@@ -199,24 +363,7 @@ class SoftAssertions:
             severity: ErrorSeverity = ErrorSeverity.MEDIUM
     ) -> "SoftAssertions":
         """Assert container does not contain item."""
-        passed = item not in container
-
-        if not passed:
-            failure_message = message or f"Expected '{container}' to not contain '{item}'"
-            screenshot_path = self._capture_screenshot("assertion_not_contains_failure")
-
-            failure = AssertionFailure(
-                message=failure_message,
-                expected=f"not contains {item}",
-                actual=container,
-                assertion_type="not_contains",
-                severity=severity,
-                screenshot_path=screenshot_path
-            )
-
-            self.failures.append(failure)
-
-        log_assertion("not_contains", f"not contains {item}", container, passed)
+        self._compare("not_contains", container, item, message, severity)
         return self
 
     def assert_matches_pattern(
@@ -227,29 +374,26 @@ class SoftAssertions:
             severity: ErrorSeverity = ErrorSeverity.MEDIUM
     ) -> "SoftAssertions":
         """Assert string matches regex pattern."""
-        if isinstance(pattern, str):
-            regex_pattern = re.compile(pattern)
-        else:
+        # Precompiled patterns are the common case; anything without a
+        # search method is treated as a pattern string
+        try:
+            search = pattern.search
             regex_pattern = pattern
+        except AttributeError:
+            regex_pattern = _compile_pattern(pattern)
+            search = regex_pattern.search
 
-        passed = bool(regex_pattern.search(actual))
+        passed = search(actual) is not None
 
         if not passed:
             failure_message = message or f"Expected '{actual}' to match pattern '{regex_pattern.pattern}'"
-            screenshot_path = self._capture_screenshot("assertion_pattern_failure")
-
-            failure = AssertionFailure(
-                message=failure_message,
-                expected=f"matches {regex_pattern.pattern}",
-                actual=actual,
-                assertion_type="matches_pattern",
-                severity=severity,
-                screenshot_path=screenshot_path
+            self._record_failure(
+                "matches_pattern", f"matches {regex_pattern.pattern}", actual, failure_message, severity,
+                "assertion_pattern_failure"
             )
 
-            self.failures.append(failure)
-
-        log_assertion("matches_pattern", regex_pattern.pattern, actual, passed)
+        if not passed or self._log_passes:
+            self._log_buffer.append(("matches_pattern", regex_pattern.pattern, actual, passed))
         return self
 
     def assert_greater_than(
@@ -260,24 +404,7 @@ class SoftAssertions:
             severity: ErrorSeverity = ErrorSeverity.MEDIUM
     ) -> "SoftAssertions":
         """Assert actual value is greater than expected."""
-        passed = actual > expected
-
-        if not passed:
-            failure_message = message or f"Expected {actual} to be greater than {expected}"
-            screenshot_path = self._capture_screenshot("assertion_greater_failure")
-
-            failure = AssertionFailure(
-                message=failure_message,
-                expected=f"> {expected}",
-                actual=actual,
-                assertion_type="greater_than",
-                severity=severity,
-                screenshot_path=screenshot_path
-            )
-
-            self.failures.append(failure)
-
-        log_assertion("greater_than", f"> {expected}", actual, passed)
+        self._compare("greater_than", actual, expected, message, severity)
         return self
 
     def assert_less_than(
@@ -288,24 +415,7 @@ class SoftAssertions:
             severity: ErrorSeverity = ErrorSeverity.MEDIUM
     ) -> "SoftAssertions":
         """Assert actual value is less than expected."""
-        passed = actual < expected
-
-        if not passed:
-            failure_message = message or f"Expected {actual} to be less than {expected}"
-            screenshot_path = self._capture_screenshot("assertion_less_failure")
-
-            failure = AssertionFailure(
-                message=failure_message,
-                expected=f"< {expected}",
-                actual=actual,
-                assertion_type="less_than",
-                severity=severity,
-                screenshot_path=screenshot_path
-            )
-
-            self.failures.append(failure)
-
-        log_assertion("less_than", f"< {expected}", actual, passed)
+        self._compare("less_than", actual, expected, message, severity)
         return self
 
     def assert_between(
@@ -327,20 +437,13 @@ class SoftAssertions:
 
         if not passed:
             failure_message = message or f"Expected {actual} to be {expected_desc}"
-            screenshot_path = self._capture_screenshot("assertion_between_failure")
-
-            failure = AssertionFailure(
-                message=failure_message,
-                expected=expected_desc,
-                actual=actual,
-                assertion_type="between",
-                severity=severity,
-                screenshot_path=screenshot_path
+            self._record_failure(
+                "between", expected_desc, actual, failure_message, severity,
+                "assertion_between_failure"
             )
 
-            self.failures.append(failure)
-
-        log_assertion("between", expected_desc, actual, passed)
+        if not passed or self._log_passes:
+            self._log_buffer.append(("between", expected_desc, actual, passed))
         return self
 
     def assert_true(
@@ -350,24 +453,7 @@ class SoftAssertions:
             severity: ErrorSeverity = ErrorSeverity.MEDIUM
     ) -> "SoftAssertions":
         """Assert condition is True."""
-        passed = condition is True
-
-        if not passed:
-            failure_message = message or f"Expected condition to be True, but got {condition}"
-            screenshot_path = self._capture_screenshot("assertion_true_failure")
-
-            failure = AssertionFailure(
-                message=failure_message,
-                expected=True,
-                actual=condition,
-                assertion_type="true",
-                severity=severity,
-                screenshot_path=screenshot_path
-            )
-
-            self.failures.append(failure)
-
-        log_assertion("true", True, condition, passed)
+        self._compare("true", condition, True, message, severity)
         return self
 
     def assert_false(
@@ -377,24 +463,7 @@ class SoftAssertions:
             severity: ErrorSeverity = ErrorSeverity.MEDIUM
     ) -> "SoftAssertions":
         """Assert condition is False."""
-        passed = condition is False
-
-        if not passed:
-            failure_message = message or f"Expected condition to be False, but got {condition}"
-            screenshot_path = self._capture_screenshot("assertion_false_failure")
-
-            failure = AssertionFailure(
-                message=failure_message,
-                expected=False,
-                actual=condition,
-                assertion_type="false",
-                severity=severity,
-                screenshot_path=screenshot_path
-            )
-
-            self.failures.append(failure)
-
-        log_assertion("false", False, condition, passed)
+        self._compare("false", condition, False, message, severity)
         return self
 
     def assert_none(
@@ -404,24 +473,7 @@ class SoftAssertions:
             severity: ErrorSeverity = ErrorSeverity.MEDIUM
     ) -> "SoftAssertions":
         """Assert value is None."""
-        passed = actual is None
-
-        if not passed:
-            failure_message = message or f"Expected None, but got {actual}"
-            screenshot_path = self._capture_screenshot("assertion_none_failure")
-
-            failure = AssertionFailure(
-                message=failure_message,
-                expected=None,
-                actual=actual,
-                assertion_type="none",
-                severity=severity,
-                screenshot_path=screenshot_path
-            )
-
-            self.failures.append(failure)
-
-        log_assertion("none", None, actual, passed)
+        self._compare("none", actual, None, message, severity)
         return self
 
     def assert_not_none(
@@ -431,24 +483,7 @@ class SoftAssertions:
             severity: ErrorSeverity = ErrorSeverity.MEDIUM
     ) -> "SoftAssertions":
         """Assert value is not None."""
-        passed = actual is not None
-
-        if not passed:
-            failure_message = message or "Expected value to not be None"
-            screenshot_path = self._capture_screenshot("assertion_not_none_failure")
-
-            failure = AssertionFailure(
-                message=failure_message,
-                expected="not None",
-                actual=actual,
-                assertion_type="not_none",
-                severity=severity,
-                screenshot_path=screenshot_path
-            )
-
-            self.failures.append(failure)
-
-        log_assertion("not_none", "not None", actual, passed)
+        self._compare("not_none", actual, None, message, severity)
         return self
 
     def add_failure(
@@ -461,20 +496,11 @@ class SoftAssertions:
             context: Optional[Dict[str, Any]] = None
     ) -> "SoftAssertions":
         """Add custom failure to soft assertions."""
-        screenshot_path = self._capture_screenshot("custom_assertion_failure")
-
-        failure = AssertionFailure(
-            message=message,
-            expected=expected,
-            actual=actual,
-            assertion_type=assertion_type,
-            severity=severity,
-            context=context or {},
-            screenshot_path=screenshot_path
+        self._record_failure(
+            assertion_type, expected, actual, message, severity,
+            "custom_assertion_failure", context
         )
 
-        self.failures.append(failure)
-
         self.logger.warning(
             "Custom soft assertion failure added",
             message=message,
@@ -484,13 +510,82 @@ class SoftAssertions:
 
         return self
 
+    def _compare(
+            self,
+            assertion_type: str,
+            actual: Any,
+            expected: Any,
+            message: Optional[str],
+            severity: ErrorSeverity
+    ) -> bool:
+        """Run a check from _SOFT_COMPARISONS, recording and logging the result."""
+        predicate, expected_format, message_format, screenshot_name = _SOFT_COMPARISONS[assertion_type]
+        passed = predicate(actual, expected)
+        if passed and not self._log_passes:
+            return True
+
+        expected_desc = expected if expected_format is None else expected_format.format(expected=expected)
+        if not passed:
+            self._record_failure(
+                assertion_type, expected_desc, actual,
+                message or message_format.format(actual=actual, expected=expected),
+                severity, screenshot_name
+            )
+
+        self._log_buffer.append((assertion_type, expected_desc, actual, passed))
+        return passed
+
+    def _record_failure(
+            self,
+            assertion_type: str,
+            expected: Any,
+            actual: Any,
+            message: str,
+            severity: ErrorSeverity,
+            screenshot_name: str,
+            context: Optional[Dict[str, Any]] = None
+    ) -> AssertionFailure:
+        """Capture screenshot and store a new assertion failure."""
+        failure = AssertionFailure(
+            message=message,
+            expected=expected,
+            actual=actual,
+            assertion_type=assertion_type,
+            severity=severity,
+            context=context or {}
+        )
+        self._capture_screenshot(screenshot_name, failure)
+        self._append_failure(failure)
+        return failure
+
+    def record_result(self, assertion_type: str, expected: Any, actual: Any, passed: bool) -> None:
+        """
+        Add an assertion result to this session's batched log.
+
+        Takes the same arguments as log_assertion, so helpers such as
+        ElementAssertions can log through either one.
+        """
+        self._log_buffer.append((assertion_type, expected, actual, passed))
+
     def has_failures(self) -> bool:
         """Check if there are any assertion failures."""
-        return len(self.failures) > 0
+        self._flush_log()
+        return bool(self.failures)
+
+    def get_failures(self) -> Sequence[AssertionFailure]:
+        """
+        Get all assertion failures.
 
-    def get_failures(self) -> List[AssertionFailure]:
-        """Get all assertion failures."""
-        return self.failures.copy()
+        Returns the live collection without copying, so failures recorded
+        later show up in it; clear_failures() starts a new list and leaves
+        results returned earlier intact. Callers must not mutate it.
+        """
+        self._flush_log()
+        return self.failures
+
+    def iter_failures(self) -> Iterator[AssertionFailure]:
+        """Iterate over assertion failures in the order they were recorded."""
+        return iter(self.failures)
 
     def get_failure_count(self) -> int:
         """Get number of failures."""
@@ -502,7 +597,9 @@ class SoftAssertions:
 
     def clear_failures(self) -> None:
         """Clear all assertion failures."""
-        self.failures.clear()
+        # A new list, so results already handed out by get_failures() survive
+        self.failures = []
+        self._append_failure = self.failures.append
 
     def assert_all(self) -> None:
         """
@@ -510,46 +607,38 @@ class SoftAssertions:
 
         This should be called at the end of test to fail if soft assertions failed.
         """
+        self._flush_log()
+        self._flush_screenshots()
+
         if self.has_failures():
-            # Group failures by severity
-            critical_failures = self.get_failures_by_severity(ErrorSeverity.CRITICAL)
-            high_failures = self.get_failures_by_severity(ErrorSeverity.HIGH)
-            medium_failures = self.get_failures_by_severity(ErrorSeverity.MEDIUM)
-            low_failures = self.get_failures_by_severity(ErrorSeverity.LOW)
-
-            # Create comprehensive failure message
-            failure_summary = []
-
-            if critical_failures:
-                failure_summary.append(f"Critical failures: {len(critical_failures)}")
-            if high_failures:
-                failure_summary.append(f"High severity failures: {len(high_failures)}")
-            if medium_failures:
-                failure_summary.append(f"Medium severity failures: {len(medium_failures)}")
-            if low_failures:
-                failure_summary.append(f"Low severity failures: {len(low_failures)}")
-
-            summary_text = ", ".join(failure_summary)
-
-            # Create detailed failure messages
-            failure_details = []
+            # Count failures by severity in a single pass
+            counts = Counter(f.severity for f in self.failures)
+
+            # Create comprehensive failure message, most severe first
+            summary_text = ", ".join(
+                f"{label}: {counts[level]}"
+                for level, label in _SEVERITY_SUMMARY_LABELS
+                if counts[level]
+            )
+
+            # Create detailed failure messages, joined once at the end
+            parts = [f"Soft assertions failed: {summary_text}"]
             for i, failure in enumerate(self.failures, 1):
-                detail = f"{i}. [{failure.assertion_type}] {failure.message}"
                 if failure.screenshot_path:
-                    detail += f" (screenshot: {failure.screenshot_path})"
-                failure_details.append(detail)
+                    parts.append(
+                        f"{i}. [{failure.assertion_type}] {failure.message}"
+                        f" (screenshot: {failure.screenshot_path})"
+                    )
+                else:
+                    parts.append(f"{i}. [{failure.assertion_type}] {failure.message}")
 
-            main_message = f"Soft assertions failed: {summary_text}\n" + "\n".join(failure_details)
+            main_message = "\n".join(parts)
 
             # Determine overall severity (highest severity wins)
-            if critical_failures:
-                severity = ErrorSeverity.CRITICAL
-            elif high_failures:
-                severity = ErrorSeverity.HIGH
-            elif medium_failures:
-                severity = ErrorSeverity.MEDIUM
-            else:
-                severity = ErrorSeverity.LOW
+            severity = next(
+                (level for level, _ in _SEVERITY_SUMMARY_LABELS if counts[level]),
+                ErrorSeverity.LOW
+            )
 
             # Create exception with all failure data
             exception = TestAssertionException(
@@ -561,25 +650,35 @@ class SoftAssertions:
 
             raise exception
 
-    def _capture_screenshot(self, name: str) -> Optional[str]:
-        """Capture screenshot if page is available."""
-        if not self.page or not self.settings.browser.screenshot_on_failure:
-            return None
-
+    def _capture_screenshot(self, name: str, failure: AssertionFailure) -> None:
+        """Capture a failure screenshot of the attached page and attach its path."""
         try:
-            screenshots_dir = Path("reports/screenshots")
-            screenshots_dir.mkdir(parents=True, exist_ok=True)
+            filename = f"soft_assertion_{name}_{self._shot_stamp}_{next(_SHOT_COUNTER)}.png"
+            screenshot_path = self._screenshots_dir / filename
 
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            filename = f"soft_assertion_{name}_{timestamp}.png"
-            screenshot_path = screenshots_dir / filename
-
-            self.page.screenshot(path=str(screenshot_path), full_page=True)
-            return str(screenshot_path)
+            # The capture must stay on this thread (Playwright sync API), but
+            # the PNG write is handed off so the next assertion can run
+            image = self.page.screenshot(full_page=True)
+            future = _screenshot_writer().submit(screenshot_path.write_bytes, image)
+            failure.screenshot_path = str(screenshot_path)
+            self._pending_screenshots.append((future, failure))
 
         except Exception as e:
             self.logger.warning(f"Failed to capture screenshot: {e}")
-            return None
+
+    def _flush_log(self) -> None:
+        """Write buffered assertion results as a single log event."""
+        _flush_records(self._log_buffer)
+
+    def _flush_screenshots(self) -> None:
+        """Wait for pending screenshot writes, unsetting paths whose write failed."""
+        pending, self._pending_screenshots = self._pending_screenshots, []
+        for future, failure in pending:
+            try:
+                future.result()
+            except Exception as e:
+                failure.screenshot_path = None
+                self.logger.warning(f"Failed to save screenshot: {e}")
 
     def __enter__(self) -> "SoftAssertions":
         """Context manager entry."""
@@ -589,6 +688,9 @@ class SoftAssertions:
         """Context manager exit - automatically call assert_all."""
         if exc_type is None:  # Only check soft assertions if no other exception
             self.assert_all()
+        else:
+            self._flush_log()
+            self._flush_screenshots()
 
 
 class CustomMatchers:
@@ -602,57 +704,39 @@ class CustomMatchers:
     @staticmethod
     def is_valid_email(email: str) -> bool:
         """Check if string is valid email format."""
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}
-        return bool(re.match(email_pattern, email))
+        return _EMAIL_RE.match(email) is not None
 
     @staticmethod
     def is_valid_phone(phone: str) -> bool:
         """Check if string is valid phone number format."""
-        phone_pattern = r'^\+?[\d\s\-\(\)]{10,}
-        return bool(re.match(phone_pattern, phone))
+        return _PHONE_RE.match(phone) is not None
 
     @staticmethod
     def is_valid_price(price: str) -> bool:
         """Check if string is valid price format."""
-        price_pattern = r'^\$?\d+\.?\d{0,2}
-        return bool(re.match(price_pattern, price))
+        return _PRICE_RE.match(price) is not None
 
     @staticmethod
     def is_valid_url(url: str) -> bool:
         """Check if string is valid URL format."""
-        url_pattern = r'^https?://[^\s/$.?#].[^\s]*
-        return bool(re.match(url_pattern, url))
+        return _URL_RE.match(url) is not None
 
     @staticmethod
     def contains_sock_sizes(text: str) -> bool:
         """Check if text contains valid sock sizes."""
-        sock_sizes = ['XS', 'S', 'M', 'L', 'XL', 'XXL']
-        return any(size in text.upper() for size in sock_sizes)
+        return _SOCK_SIZES_RE.search(text) is not None
 
     @staticmethod
     def is_valid_credit_card(card_number: str) -> bool:
         """Check if string is valid credit card number format."""
         # Remove spaces and hyphens
-        cleaned = re.sub(r'[\s-]', '', card_number)
+        cleaned = _CC_STRIP_RE.sub('', card_number)
 
         # Check length and digits only
-        if not re.match(r'^\d{13,19}, cleaned):
+        if _CC_DIGITS_RE.match(cleaned) is None:
             return False
 
-        # Simple Luhn algorithm check
-        def luhn_checksum(card_num):
-            def digits_of(n):
-                return [int(d) for d in str(n)]
-
-            digits = digits_of(card_num)
-            odd_digits = digits[-1::-2]
-            even_digits = digits[-2::-2]
-            checksum = sum(odd_digits)
-            for d in even_digits:
-                checksum += sum(digits_of(d * 2))
-            return checksum % 10
-
-        return luhn_checksum(cleaned) == 0
+        return _luhn_valid(cleaned)
 
 
 class ElementAssertions:
@@ -663,17 +747,25 @@ class ElementAssertions:
     comprehensive element validation.
     """
 
-    def __init__(self, locator: Union[Locator, AsyncLocator], page: Optional[Union[Page, AsyncPage]] = None):
+    def __init__(
+            self,
+            locator: Union[Locator, AsyncLocator],
+            page: Optional[Union[Page, AsyncPage]] = None,
+            soft_context: Optional[SoftAssertions] = None
+    ):
         """
         Initialize element assertions.
 
         Args:
             locator: Element locator
             page: Optional page for screenshots
+            soft_context: Optional soft assertion session whose batched
+                log these results join instead of being logged one by one
         """
         self.locator = locator
         self.page = page
-        self.logger = get_logger("element_assertions")
+        self.logger = _logger("element_assertions")
+        self._log_assertion = soft_context.record_result if soft_context is not None else log_assertion
 
     def should_be_visible(
             self,
@@ -683,10 +775,10 @@ class ElementAssertions:
         """Assert element is visible."""
         try:
             expect(self.locator).to_be_visible(timeout=timeout or 30000)
-            log_assertion("element_visible", True, True, True)
+            self._log_assertion("element_visible", True, True, True)
         except Exception as e:
-            log_assertion("element_visible", True, False, False)
-            failure_message = message or f"Element should be visible but is not"
+            self._log_assertion("element_visible", True, False, False)
+            failure_message = message or "Element should be visible but is not"
             raise ElementException(
                 failure_message,
                 original_exception=e
@@ -701,10 +793,10 @@ class ElementAssertions:
         """Assert element is hidden."""
         try:
             expect(self.locator).to_be_hidden(timeout=timeout or 30000)
-            log_assertion("element_hidden", True, True, True)
+            self._log_assertion("element_hidden", True, True, True)
         except Exception as e:
-            log_assertion("element_hidden", True, False, False)
-            failure_message = message or f"Element should be hidden but is visible"
+            self._log_assertion("element_hidden", True, False, False)
+            failure_message = message or "Element should be hidden but is visible"
             raise ElementException(
                 failure_message,
                 original_exception=e
@@ -728,10 +820,10 @@ class ElementAssertions:
                     timeout=timeout or 30000,
                     ignore_case=True
                 )
-            log_assertion("element_contains_text", expected_text, "found", True)
+            self._log_assertion("element_contains_text", expected_text, "found", True)
         except Exception as e:
-            actual_text = self.locator.text_content() or ""
-            log_assertion("element_contains_text", expected_text, actual_text, False)
+            actual_text = _actual_from_failure(e)
+            self._log_assertion("element_contains_text", expected_text, actual_text, False)
             failure_message = message or f"Element should contain text '{expected_text}' but contains '{actual_text}'"
             raise ElementException(
                 failure_message,
@@ -748,10 +840,10 @@ class ElementAssertions:
         """Assert element has exact text."""
         try:
             expect(self.locator).to_have_text(expected_text, timeout=timeout or 30000)
-            log_assertion("element_exact_text", expected_text, expected_text, True)
+            self._log_assertion("element_exact_text", expected_text, expected_text, True)
         except Exception as e:
-            actual_text = self.locator.text_content() or ""
-            log_assertion("element_exact_text", expected_text, actual_text, False)
+            actual_text = _actual_from_failure(e)
+            self._log_assertion("element_exact_text", expected_text, actual_text, False)
             failure_message = message or f"Element should have text '{expected_text}' but has '{actual_text}'"
             raise ElementException(
                 failure_message,
@@ -779,10 +871,10 @@ class ElementAssertions:
                     attribute_name,
                     timeout=timeout or 30000
                 )
-            log_assertion("element_attribute", expected_value or "present", "found", True)
+            self._log_assertion("element_attribute", expected_value or "present", "found", True)
         except Exception as e:
-            actual_value = self.locator.get_attribute(attribute_name)
-            log_assertion("element_attribute", expected_value, actual_value, False)
+            actual_value = _actual_from_failure(e)
+            self._log_assertion("element_attribute", expected_value, actual_value, False)
             failure_message = message or f"Element attribute '{attribute_name}' assertion failed"
             raise ElementException(
                 failure_message,
@@ -799,10 +891,10 @@ class ElementAssertions:
         """Assert element has specific CSS class."""
         try:
             expect(self.locator).to_have_class(class_name, timeout=timeout or 30000)
-            log_assertion("element_class", class_name, "found", True)
+            self._log_assertion("element_class", class_name, "found", True)
         except Exception as e:
-            actual_classes = self.locator.get_attribute("class") or ""
-            log_assertion("element_class", class_name, actual_classes, False)
+            actual_classes = _actual_from_failure(e)
+            self._log_assertion("element_class", class_name, actual_classes, False)
             failure_message = message or f"Element should have class '{class_name}' but has classes '{actual_classes}'"
             raise ElementException(
                 failure_message,
@@ -818,9 +910,9 @@ class ElementAssertions:
         """Assert element is enabled."""
         try:
             expect(self.locator).to_be_enabled(timeout=timeout or 30000)
-            log_assertion("element_enabled", True, True, True)
+            self._log_assertion("element_enabled", True, True, True)
         except Exception as e:
-            log_assertion("element_enabled", True, False, False)
+            self._log_assertion("element_enabled", True, False, False)
             failure_message = message or "Element should be enabled but is disabled"
             raise ElementException(
                 failure_message,
@@ -836,9 +928,9 @@ class ElementAssertions:
         """Assert element is disabled."""
         try:
             expect(self.locator).to_be_disabled(timeout=timeout or 30000)
-            log_assertion("element_disabled", True, True, True)
+            self._log_assertion("element_disabled", True, True, True)
         except Exception as e:
-            log_assertion("element_disabled", True, False, False)
+            self._log_assertion("element_disabled", True, False, False)
             failure_message = message or "Element should be disabled but is enabled"
             raise ElementException(
                 failure_message,
@@ -855,10 +947,12 @@ class ElementAssertions:
         """Assert locator matches expected number of elements."""
         try:
             expect(self.locator).to_have_count(expected_count, timeout=timeout or 30000)
-            log_assertion("element_count", expected_count, expected_count, True)
+            self._log_assertion("element_count", expected_count, expected_count, True)
         except Exception as e:
-            actual_count = self.locator.count()
-            log_assertion("element_count", expected_count, actual_count, False)
+            # Reuse the count expect() last saw rather than asking the page again
+            actual = _actual_from_failure(e)
+            actual_count = int(actual) if actual.isdigit() else actual or "unknown"
+            self._log_assertion("element_count", expected_count, actual_count, False)
             failure_message = message or f"Expected {expected_count} elements but found {actual_count}"
             raise ElementException(
                 failure_message,
@@ -883,8 +977,27 @@ class PerformanceAssertions:
             page: Playwright page instance
         """
         self.page = page
-        self.logger = get_logger("performance_assertions")
+        self.logger = _logger("performance_assertions")
         self.settings = get_settings()
+        self._cached_snapshot: Optional[Dict[str, Any]] = None
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """
+        Read the page's performance metrics in one evaluate call.
+
+        The result is kept for the lifetime of this instance so chained
+        assertions share one round-trip; create a new instance after the
+        page navigates.
+        """
+        if self._cached_snapshot is None:
+            if self.page not in _PERF_READY_PAGES:
+                # Future documents get the helpers at start; the current one now
+                self.page.add_init_script(_PERF_INIT_JS)
+                self.page.evaluate(_PERF_INIT_JS)
+                _PERF_READY_PAGES.add(self.page)
+
+            self._cached_snapshot = self.page.evaluate(_PERF_SNAPSHOT_JS)
+        return self._cached_snapshot
 
     def page_load_time_should_be_less_than(
             self,
@@ -893,13 +1006,7 @@ class PerformanceAssertions:
     ) -> "PerformanceAssertions":
         """Assert page load time is within acceptable limits."""
         try:
-            # Use Navigation Timing API to get load time
-            load_time = self.page.evaluate("""
-                () => {
-                    const perfData = performance.getEntriesByType('navigation')[0];
-                    return perfData ? perfData.loadEventEnd - perfData.navigationStart : 0;
-                }
-            """)
+            load_time = self._snapshot()["load"]
 
             load_time_seconds = load_time / 1000
             passed = load_time_seconds <= max_seconds
@@ -928,10 +1035,7 @@ class PerformanceAssertions:
     ) -> "PerformanceAssertions":
         """Assert number of network requests is reasonable."""
         try:
-            # Get resource timing entries
-            request_count = self.page.evaluate("""
-                () => performance.getEntriesByType('resource').length
-            """)
+            request_count = self._snapshot()["reqs"]
 
             passed = request_count <= max_requests
 
@@ -955,9 +1059,10 @@ class PerformanceAssertions:
 
 # Convenience functions for creating assertions
 def assert_that(locator: Union[Locator, AsyncLocator],
-                page: Optional[Union[Page, AsyncPage]] = None) -> ElementAssertions:
+                page: Optional[Union[Page, AsyncPage]] = None,
+                soft_context: Optional[SoftAssertions] = None) -> ElementAssertions:
     """Create element assertions for locator."""
-    return ElementAssertions(locator, page)
+    return ElementAssertions(locator, page, soft_context)
 
 
 def soft_assert(page: Optional[Union[Page, AsyncPage]] = None) -> SoftAssertions:
@@ -974,6 +1079,7 @@ def assert_performance(page: Union[Page, AsyncPage]) -> PerformanceAssertions:
 def with_soft_assertions(func):
     """Decorator that automatically creates and checks soft assertions."""
 
+    @wraps(func)
     def wrapper(*args, **kwargs):
         # Assume first argument has a page attribute (page object pattern)
         page = getattr(args[0], 'page', None) if args else None
@@ -7,8 +7,7 @@ correctly across different environments and scenarios.
 """
 
 import os
-import tempfile
-from pathlib import Path
+from operator import attrgetter
 from unittest.mock import patch
 
 import pytest
@@ -20,8 +19,82 @@ from src.config.environments import (
     initialize_environment,
     get_environment_config
 )
-from src.core.browser_manager import get_browser_manager, BrowserManager
-from src.core.logger import setup_logging, get_logger
+from src.core import browser_manager as browser_manager_module
+from src.core.browser_manager import get_browser_manager, cleanup_browsers, BrowserManager
+from src.core.logger import setup_logging, get_logger, flush_logs
+
+
+# Named environment scenarios shared by the integration tests
+CONFIG_SCENARIOS = {
+    "development_firefox": {
+        "ENVIRONMENT": "development",
+        "BROWSER__NAME": "firefox",
+        "BROWSER__HEADLESS": "false",
+        "BROWSER__TIMEOUT": "45000"
+    },
+    "testing_chromium": {
+        "ENVIRONMENT": "testing",
+        "BROWSER__NAME": "chromium",
+        "BROWSER__HEADLESS": "true",
+        "API__BASE_URL": "http://localhost:8080/api",
+        "TEST__PARALLEL_WORKERS": "2"
+    },
+}
+
+
+# Payloads for the validation tests, nested per settings section so that
+# they reach the section validators
+INVALID_FIELDS_PAYLOAD = {
+    "browser": {"timeout": 0},  # Invalid timeout
+    "api": {"base_url": "invalid-url"}  # Invalid URL
+}
+INCONSISTENT_PRODUCTION_PAYLOAD = {
+    "environment": "production",
+    "debug": True,  # Corrected to False in production
+    "browser": {"headless": False}  # Corrected to headless in production
+}
+
+
+# Exact values each environment must end up with, keyed by dotted attribute path
+EXPECTED_ENVIRONMENT_SETTINGS = {
+    "development": {"environment.value": "development"},
+    "testing": {"environment.value": "testing", "browser.headless": True},
+    "staging": {"environment.value": "staging"},
+    "production": {
+        "environment.value": "production",
+        "browser.headless": True,
+        "debug": False,
+        "api.validate_ssl": True
+    },
+}
+
+
+def settings_subset(settings: Settings, paths) -> dict:
+    """Read the given dotted attribute paths from settings into a dict."""
+    return {path: attrgetter(path)(settings) for path in paths}
+
+
+@pytest.fixture(scope="session")
+def scenario_settings():
+    """Build the Settings for each named scenario once per session."""
+    built = {}
+
+    def settings_for(name: str) -> Settings:
+        if name not in built:
+            # Environment is patched only while building, so it never leaks
+            with patch.dict(os.environ, CONFIG_SCENARIOS[name]):
+                built[name] = Settings()
+        return built[name]
+
+    return settings_for
+
+
+@pytest.fixture
+def fresh_browser_manager(monkeypatch):
+    """Start without a global browser manager and clean up the one the test creates."""
+    monkeypatch.setattr(browser_manager_module, "_browser_manager", None)
+    yield
+    cleanup_browsers()
 
 
 class TestConfigurationIntegration:
@@ -45,12 +118,11 @@ class TestConfigurationIntegration:
             env = detector.detect_environment()
             assert env.value == "development"
 
-    def test_configuration_loading_with_env_files(self):
+    def test_configuration_loading_with_env_files(self, tmp_path):
         """Test configuration loading with actual .env files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test .env file
-            env_file = Path(temp_dir) / ".env"
-            env_file.write_text("""
+        # Create test .env file
+        env_file = tmp_path / ".env"
+        env_file.write_text("""
 ENVIRONMENT=testing
 DEBUG=true
 BROWSER__NAME=chromium
@@ -60,113 +132,96 @@ BROWSER__TIMEOUT=20000
 API__BASE_URL=http://test.local:8080/api
 """)
 
-            # Change working directory temporarily
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(temp_dir)
+        # Point settings at the file directly instead of changing directory
+        settings = Settings(_env_file=env_file)
 
-                # Reload settings to pick up new .env file
-                reload_settings()
-                settings = get_settings()
+        assert settings.environment.value == "testing"
+        assert settings.debug is True
+        assert settings.browser.name == "chromium"
+        assert settings.browser.headless is True
+        assert settings.browser.viewport_width == 1600
+        assert settings.browser.timeout == 20000
+        assert "test.local" in settings.api.base_url
 
-                assert settings.environment.value == "testing"
-                assert settings.debug is True
-                assert settings.browser.name == "chromium"
-                assert settings.browser.headless is True
-                assert settings.browser.viewport_width == 1600
-                assert settings.browser.timeout == 20000
-                assert "test.local" in settings.api.base_url
-
-            finally:
-                os.chdir(original_cwd)
-
-    def test_browser_manager_with_configuration(self):
+    def test_browser_manager_with_configuration(self, scenario_settings):
         """Test browser manager integration with configuration."""
         # Test with development configuration
-        with patch.dict(os.environ, {
-            "ENVIRONMENT": "development",
-            "BROWSER__NAME": "firefox",
-            "BROWSER__HEADLESS": "false",
-            "BROWSER__TIMEOUT": "45000"
-        }):
-            reload_settings()
-            manager = BrowserManager()
+        manager = BrowserManager(scenario_settings("development_firefox"))
 
-            # Verify configuration is applied
-            assert manager.settings.browser.name == "firefox"
-            assert manager.settings.browser.headless is False
-            assert manager.settings.browser.timeout == 45000
+        # Verify configuration is applied
+        assert manager.settings.browser.name == "firefox"
+        assert manager.settings.browser.headless is False
+        assert manager.settings.browser.timeout == 45000
 
-            # Test launch options generation
-            launch_options = manager.factory.create_launch_options()
-            assert launch_options["headless"] is False
-            assert launch_options["timeout"] == 45000
+        # Test launch options generation
+        launch_options = manager.factory.create_launch_options()
+        assert launch_options["headless"] is False
+        assert launch_options["timeout"] == 45000
 
-    def test_logging_configuration_integration(self):
+    def test_logging_configuration_integration(self, tmp_path):
         """Test logging system integration with settings."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = Path(temp_dir) / "test.log"
-
-            # Configure logging with settings
-            setup_logging(
-                log_level="DEBUG",
-                enable_file=True,
-                log_file_path=log_file,
-                enable_json_format=True
-            )
-
-            # Test logging functionality
-            logger = get_logger("test_integration")
-            logger.info("Integration test message", component="configuration")
-
-            # Verify log file was created and contains expected content
-            assert log_file.exists()
-            log_content = log_file.read_text()
-            assert "Integration test message" in log_content
-            assert "configuration" in log_content
-
-    def test_cross_environment_configuration(self):
+        log_file = tmp_path / "test.log"
+
+        # Configure logging with settings
+        setup_logging(
+            log_level="DEBUG",
+            enable_file=True,
+            log_file_path=log_file,
+            enable_json_format=True
+        )
+
+        # Test logging functionality
+        logger = get_logger("test_integration")
+        logger.info("Integration test message", component="configuration")
+
+        # File output is written on a listener thread; wait for it
+        flush_logs()
+
+        # Verify log file was created and contains expected content
+        assert log_file.exists()
+        assert log_file.stat().st_size > 0
+
+        # Scan line by line and stop as soon as everything has been seen
+        missing = {"Integration test message", "configuration"}
+        with log_file.open(encoding="utf-8") as log_lines:
+            for line in log_lines:
+                missing = {text for text in missing if text not in line}
+                if not missing:
+                    break
+        assert not missing, f"Not found in log file: {missing}"
+
+    @pytest.mark.parametrize("env", list(EXPECTED_ENVIRONMENT_SETTINGS))
+    def test_cross_environment_configuration(self, env):
         """Test configuration behavior across different environments."""
-        environments = ["development", "testing", "staging", "production"]
-
-        for env in environments:
-            with patch.dict(os.environ, {"ENVIRONMENT": env}):
-                reload_settings()
-                settings = get_settings()
-
-                assert settings.environment.value == env
+        with patch.dict(os.environ, {"ENVIRONMENT": env}):
+            reload_settings()
+            settings = get_settings()
 
-                # Verify environment-specific adaptations
-                if env == "production":
-                    assert settings.browser.headless is True
-                    assert settings.debug is False
-                    assert settings.api.validate_ssl is True
+            # Verify environment-specific adaptations in one comparison
+            expected = EXPECTED_ENVIRONMENT_SETTINGS[env]
+            assert settings_subset(settings, expected) == expected
 
-                elif env == "development":
-                    # Development can have flexible settings
-                    assert settings.logging.level in ["DEBUG", "INFO"]
+            if env == "development":
+                # Development can have flexible settings
+                assert settings.logging.level in ["DEBUG", "INFO"]
 
-                elif env == "testing":
-                    assert settings.browser.headless is True
-                    # Testing should have reasonable timeouts
-                    assert settings.browser.timeout <= 30000
+            elif env == "testing":
+                # Testing should have reasonable timeouts
+                assert settings.browser.timeout <= 30000
 
     def test_configuration_validation_integration(self):
         """Test configuration validation across components."""
-        # Test invalid configuration
-        with pytest.raises(ValueError):
-            Settings(
-                browser__timeout=0,  # Invalid timeout
-                api__base_url="invalid-url"  # Invalid URL
-            )
+        # Settings always merges environment variables and .env files into
+        # its input, so clear both to check the payloads alone
+        with patch.dict(os.environ, {}, clear=True):
+            # Test invalid configuration
+            with pytest.raises(ValueError):
+                Settings(_env_file=None, **INVALID_FIELDS_PAYLOAD)
 
-        # Test configuration consistency validation
-        with pytest.raises(ValueError):
-            Settings(
-                environment="production",
-                debug=True,  # Debug shouldn't be enabled in production
-                browser__headless=False  # Non-headless in production
-            )
+            # Test configuration consistency: production hardens unsafe values
+            settings = Settings(_env_file=None, **INCONSISTENT_PRODUCTION_PAYLOAD)
+            assert settings.debug is False
+            assert settings.browser.headless is True
 
     @pytest.mark.asyncio
     async def test_async_configuration_integration(self):
@@ -200,36 +255,21 @@ API__BASE_URL=http://test.local:8080/api
             with pytest.raises(ValueError):
                 Settings()
 
-    def test_configuration_override_precedence(self):
+    def test_configuration_override_precedence(self, tmp_path):
         """Test configuration override precedence order."""
         # Test that environment variables override .env files
-        with tempfile.TemporaryDirectory() as temp_dir:
-            env_file = Path(temp_dir) / ".env"
-            env_file.write_text("BROWSER__HEADLESS=false\n")
-
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(temp_dir)
-
-                # Environment variable should override .env file
-                with patch.dict(os.environ, {"BROWSER__HEADLESS": "true"}):
-                    reload_settings()
-                    settings = get_settings()
-                    assert settings.browser.headless is True
+        env_file = tmp_path / ".env"
+        env_file.write_text("BROWSER__HEADLESS=false\n")
 
-            finally:
-                os.chdir(original_cwd)
+        # Environment variable should override .env file
+        with patch.dict(os.environ, {"BROWSER__HEADLESS": "true"}):
+            settings = Settings(_env_file=env_file)
+            assert settings.browser.headless is True
 
-    def test_full_framework_integration(self):
+    def test_full_framework_integration(self, fresh_browser_manager):
         """Test full framework integration with realistic scenario."""
         # Simulate a complete test scenario with configuration
-        with patch.dict(os.environ, {
-            "ENVIRONMENT": "testing",
-            "BROWSER__NAME": "chromium",
-            "BROWSER__HEADLESS": "true",
-            "API__BASE_URL": "http://localhost:8080/api",
-            "TEST__PARALLEL_WORKERS": "2"
-        }):
+        with patch.dict(os.environ, CONFIG_SCENARIOS["testing_chromium"]):
             # Initialize environment
             config = initialize_environment()
 
@@ -0,0 +1,24 @@
+# tests/unit/test_assertion_helpers.py
+"""
+Unit tests for the assertion helpers.
+
+These tests cover the pure matchers that do not need a browser page.
+"""
+
+import pytest
+
+from src.utils.assertion_helpers import CustomMatchers
+
+
+class TestContainsSockSizes:
+    """Test CustomMatchers.contains_sock_sizes whole-token matching."""
+
+    @pytest.mark.parametrize("text", ["Size: M", "xxl", "Available in S, M and L", "XS/XL"])
+    def test_size_token_is_found(self, text):
+        """Test standalone size tokens match, in any case."""
+        assert CustomMatchers.contains_sock_sizes(text) is True
+
+    @pytest.mark.parametrize("text", ["Classic socks", "XLarge", "Medium", ""])
+    def test_size_letters_inside_words_do_not_match(self, text):
+        """Test size letters that are only part of a longer word do not match."""
+        assert CustomMatchers.contains_sock_sizes(text) is False
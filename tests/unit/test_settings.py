@@ -0,0 +1,63 @@
+# tests/unit/test_settings.py
+"""
+Unit tests for settings caching and reloading.
+
+These tests exercise reload_settings() against the real Settings model
+without launching browsers or other framework components.
+"""
+
+from src.config.settings import Settings, get_settings, reload_settings
+
+
+class TestReloadSettings:
+    """Test reload_settings() cache handling."""
+
+    def setup_method(self):
+        """Start every test from an empty settings cache."""
+        get_settings.cache_clear()
+
+    def test_unchanged_environment_reuses_settings(self, monkeypatch):
+        """Test a reload with nothing changed returns the cached instance."""
+        monkeypatch.setenv("ENVIRONMENT", "staging")
+
+        first = reload_settings()
+
+        assert reload_settings() is first
+
+    def test_reload_after_external_cache_clear(self, monkeypatch):
+        """Test reload rebuilds when get_settings was rebuilt elsewhere in between."""
+        monkeypatch.setenv("ENVIRONMENT", "production")
+        reload_settings()
+
+        # Someone else clears and repopulates the cache under another environment
+        monkeypatch.setenv("ENVIRONMENT", "development")
+        get_settings.cache_clear()
+        assert get_settings().environment.value == "development"
+
+        monkeypatch.setenv("ENVIRONMENT", "production")
+        settings = reload_settings()
+
+        assert settings.environment.value == "production"
+        assert get_settings() is settings
+
+    def test_force_always_rebuilds(self, monkeypatch):
+        """Test force=True rebuilds even when nothing changed."""
+        monkeypatch.setenv("ENVIRONMENT", "staging")
+
+        first = reload_settings()
+
+        assert reload_settings(force=True) is not first
+
+    def test_changed_secret_rebuilds(self, monkeypatch, tmp_path):
+        """Test a changed file in the secrets directory is picked up."""
+        monkeypatch.setenv("ENVIRONMENT", "staging")
+        monkeypatch.delenv("DEBUG", raising=False)
+        monkeypatch.setitem(Settings.model_config, "secrets_dir", str(tmp_path))
+        secret = tmp_path / "debug"
+        secret.write_text("true")
+
+        assert reload_settings().debug is True
+
+        secret.write_text("false")
+
+        assert reload_settings().debug is False
@@ -0,0 +1,132 @@
+# tests/unit/test_user_models.py
+"""
+Unit tests for the user domain models.
+
+These tests cover validation and defaulting rules of the user models
+that do not need a browser or external services.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+# The model modules import their siblings by bare name (e.g. "from base import ...")
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src" / "models"))
+
+from user import User, UserProfile, UserRead  # noqa: E402
+
+CONTACT = {"email": "john.doe@example.com"}
+
+
+class TestUserProfile:
+    """Test UserProfile defaults and validation."""
+
+    def test_profile_without_contact_is_rejected(self):
+        """Test the default contact still requires a contact method."""
+        with pytest.raises(ValidationError, match="At least one contact method"):
+            UserProfile(first_name="John", last_name="Doe")
+
+    @pytest.mark.parametrize("display_name", [None, "", "   "])
+    def test_missing_display_name_is_generated(self, display_name):
+        """Test empty or whitespace-only display names are generated from the name."""
+        profile = UserProfile(
+            first_name="John", last_name="Doe", display_name=display_name, contact=CONTACT
+        )
+
+        assert profile.display_name == "John D."
+
+    def test_profiles_do_not_share_contact(self):
+        """Test each profile gets its own ContactInfo instance."""
+        first = UserProfile(first_name="John", last_name="Doe", contact=CONTACT)
+        second = UserProfile(first_name="Jane", last_name="Roe", contact=CONTACT)
+
+        first.contact.email = "changed@example.com"
+
+        assert first.contact is not second.contact
+        assert second.contact.email == "john.doe@example.com"
+
+
+class TestCreateNewUser:
+    """Test the User.create_new_user factory."""
+
+    @pytest.mark.parametrize("username", ["x", "bad name!", "a" * 51])
+    def test_invalid_username_is_rejected(self, username):
+        """Test username length and pattern constraints still apply."""
+        with pytest.raises(ValidationError):
+            User.create_new_user(
+                username=username,
+                email="john.doe@example.com",
+                first_name="John",
+                last_name="Doe",
+                password_hash="hash",
+                salt="salt"
+            )
+
+    def test_blocked_email_domain_is_rejected(self):
+        """Test the disposable email domain check still applies."""
+        with pytest.raises(ValidationError, match="Email domain tempmail.com is not allowed"):
+            User.create_new_user(
+                username="john_doe",
+                email="john@tempmail.com",
+                first_name="John",
+                last_name="Doe",
+                password_hash="hash",
+                salt="salt"
+            )
+
+
+class TestUserState:
+    """Test User state consistency validation."""
+
+    @staticmethod
+    def user_data(**overrides):
+        """Build minimal User input, with overrides applied."""
+        data = {
+            "credentials": {
+                "username": "john_doe",
+                "email": "john.doe@example.com",
+                "password_hash": "hash",
+                "salt": "salt"
+            },
+            "profile": {"first_name": "John", "last_name": "Doe", "contact": CONTACT}
+        }
+        data.update(overrides)
+        return data
+
+    def test_active_user_requires_verified_email(self):
+        """Test an active user with an unverified email is rejected."""
+        with pytest.raises(ValidationError, match="Active users must have verified email"):
+            User(**self.user_data(status="active"))
+
+    def test_contact_email_must_match_credentials(self):
+        """Test the contact email has to match the credentials email."""
+        profile = {
+            "first_name": "John",
+            "last_name": "Doe",
+            "contact": {"email": "other@example.com"}
+        }
+        with pytest.raises(ValidationError, match="Contact email must match credentials email"):
+            User(**self.user_data(profile=profile))
+
+
+class TestUserRead:
+    """Test the UserRead read-side snapshot."""
+
+    def test_to_dict_matches_public_dict(self):
+        """Test enum fields are serialized as plain values, like to_public_dict."""
+        user = User.create_new_user(
+            username="john_doe",
+            email="john.doe@example.com",
+            first_name="John",
+            last_name="Doe",
+            password_hash="hash",
+            salt="salt"
+        )
+
+        data = UserRead.from_user(user).to_dict()
+
+        assert data["role"] == "customer"
+        assert data["status"] == "pending_verification"
+        assert data == user.to_public_dict()